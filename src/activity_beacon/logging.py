@@ -5,6 +5,9 @@ import sys
 from typing import Literal
 
 COMPONENT_LOGGERS: dict[str, logging.Logger] = {}
+# Names of every logger get_logger has attached handlers to; lets test
+# teardown reset just these instead of scanning the global logger registry.
+REGISTERED_LOGGER_NAMES: set[str] = set()
 
 
 def get_default_log_dir() -> Path:
@@ -18,6 +21,7 @@ def get_logger(name: str, log_dir: Path | None = None) -> logging.Logger:
 
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
+    REGISTERED_LOGGER_NAMES.add(name)
 
     log_format = "%(asctime)s - %(levelname)s - %(message)s"
     date_format = "%Y-%m-%d %H:%M:%S"
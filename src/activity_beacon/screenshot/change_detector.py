@@ -49,22 +49,10 @@ class ChangeDetector:
                 )
                 return True
 
-            # Convert images to numpy arrays
-            prev_array = np.array(previous_image)
-            curr_array = np.array(current_image)
-
-            # Calculate absolute pixel differences
-            diff = np.abs(curr_array.astype(np.int16) - prev_array.astype(np.int16))
-
-            # Check if any pixel difference exceeds threshold
-            max_diff_value = np.max(diff)  # type: ignore[reportAny]
-            max_diff: int = int(max_diff_value)  # type: ignore[reportAny]
-            changed: bool = max_diff > self.threshold
-
-            logger.debug(
-                f"Image comparison: max_diff={max_diff}, threshold={self.threshold}, changed={changed}"
+            # np.asarray reads Pillow's buffer without a second copy
+            return self._has_changed_array(
+                np.asarray(previous_image), np.asarray(current_image)
             )
-            return changed
 
         except (ValueError, TypeError, AttributeError) as e:
             self.last_error_msg = str(e)
@@ -72,6 +60,31 @@ class ChangeDetector:
             # On error, assume changed to avoid missing captures
             return True
 
+    def _has_changed_array(
+        self, prev_array: np.ndarray, curr_array: np.ndarray
+    ) -> bool:
+        """Check whether two same-shaped image arrays differ beyond the threshold.
+
+        Args:
+            prev_array: Pixel array of the previous screenshot.
+            curr_array: Pixel array of the current screenshot.
+
+        Returns:
+            True if any channel differs by more than the threshold.
+        """
+        # Calculate absolute pixel differences
+        diff = np.abs(curr_array.astype(np.int16) - prev_array.astype(np.int16))
+
+        # Check if any pixel difference exceeds threshold
+        max_diff_value = np.max(diff)  # type: ignore[reportAny]
+        max_diff: int = int(max_diff_value)  # type: ignore[reportAny]
+        changed: bool = max_diff > self.threshold
+
+        logger.debug(
+            f"Image comparison: max_diff={max_diff}, threshold={self.threshold}, changed={changed}"
+        )
+        return changed
+
     def calculate_difference_percentage(
         self, previous_image: Image.Image, current_image: Image.Image
     ) -> float:
@@ -92,8 +105,8 @@ class ChangeDetector:
 
         try:
             # Convert images to numpy arrays
-            prev_array = np.array(previous_image)
-            curr_array = np.array(current_image)
+            prev_array = np.asarray(previous_image)
+            curr_array = np.asarray(current_image)
 
             # Calculate absolute pixel differences
             diff = np.abs(curr_array.astype(np.int16) - prev_array.astype(np.int16))
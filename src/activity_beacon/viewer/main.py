@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import atexit
+from collections import OrderedDict
 import contextlib
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
+import logging.handlers
 from pathlib import Path
+import queue
 import sys
 from typing import TYPE_CHECKING
 
@@ -21,11 +25,7 @@ from PyQt6.QtWidgets import (
 
 from activity_beacon.__main__ import load_settings
 
-from .calendar_widget import CalendarWidget
 from .filesystem_reader import FileSystemReader
-from .video_player import VideoPlayerWidget
-from .window_data_parser import WindowDataParser
-from .window_data_timeline import WindowDataTimeline
 
 if TYPE_CHECKING:
     from datetime import date as date_type
@@ -33,7 +33,13 @@ if TYPE_CHECKING:
     from PyQt6.QtCore import QDate
     from PyQt6.QtGui import QResizeEvent
 
-    from .window_data_parser import WindowDataEntry
+    from .calendar_widget import CalendarWidget
+    from .video_player import VideoPlayerWidget
+    from .window_data_parser import WindowDataEntry, WindowDataParser
+    from .window_data_timeline import WindowDataTimeline
+
+LOG_BUFFER_CAPACITY = 512
+ENTRY_CACHE_SIZE = 8
 
 
 class MainWindow(QMainWindow):
@@ -48,7 +54,10 @@ class MainWindow(QMainWindow):
             except (ValueError, OSError):
                 self._base_dir = Path.home() / "Documents" / "Screenshots"
         self._fs = FileSystemReader(self._base_dir)
-        self._parser = WindowDataParser()
+        self._parser: WindowDataParser | None = None
+        self._entry_cache: OrderedDict[tuple[str, int], list[WindowDataEntry]] = (
+            OrderedDict()
+        )
 
         self._calendar: CalendarWidget | None = None
         self._video_player: VideoPlayerWidget | None = None
@@ -65,6 +74,11 @@ class MainWindow(QMainWindow):
         self.setup_ui()
 
     def setup_ui(self) -> None:
+        # Widget modules pull in QtMultimedia; import them only when building the UI
+        from .calendar_widget import CalendarWidget  # noqa: PLC0415
+        from .video_player import VideoPlayerWidget  # noqa: PLC0415
+        from .window_data_timeline import WindowDataTimeline  # noqa: PLC0415
+
         central = QWidget()
         root = QVBoxLayout()
         root.setContentsMargins(0, 0, 0, 0)
@@ -144,7 +158,8 @@ class MainWindow(QMainWindow):
     ) -> None:
         """Load video and window data for the selected date."""
         if self._video_player:
-            self._video_player.load_video(video_path)
+            # get_video_path has already verified the file exists
+            self._video_player.load_video(video_path, skip_check=True)
             self._video_player.play()
 
         entries = self._load_window_data(py_date)
@@ -162,7 +177,7 @@ class MainWindow(QMainWindow):
             self.statusBar().showMessage("Loading window data…", 2000)
             if self._progress:
                 self._progress.show()
-            entries = self._parser.parse_file(wd_path)
+            entries = self._parse_window_data(wd_path, py_date)
             self.update_window_data(entries)
             if self._progress:
                 self._progress.hide()
@@ -170,6 +185,39 @@ class MainWindow(QMainWindow):
             self._timeline.clear()
         return entries
 
+    def _parse_window_data(
+        self, wd_path: Path, py_date: date_type
+    ) -> list[WindowDataEntry]:
+        """Parse a window data file, reusing recent results if it is unchanged."""
+        try:
+            key = (str(wd_path), wd_path.stat().st_mtime_ns)
+        except OSError:
+            key = None
+        if key is not None and (hit := self._entry_cache.get(key)) is not None:
+            self._entry_cache.move_to_end(key)
+            return hit
+
+        # Date directories and timestamps are both UTC, so the day's
+        # entries sort between this date and the next as ISO strings
+        entries = self._get_parser().parse_file(
+            wd_path,
+            min_iso=py_date.isoformat(),
+            max_iso=(py_date + timedelta(days=1)).isoformat(),
+        )
+        if key is not None:
+            self._entry_cache[key] = entries
+            if len(self._entry_cache) > ENTRY_CACHE_SIZE:
+                self._entry_cache.popitem(last=False)
+        return entries
+
+    def _get_parser(self) -> WindowDataParser:
+        """Create the window data parser on first use."""
+        if self._parser is None:
+            from .window_data_parser import WindowDataParser  # noqa: PLC0415
+
+            self._parser = WindowDataParser()
+        return self._parser
+
     @staticmethod
     def _get_video_start_datetime(
         entries: list[WindowDataEntry], date: QDate
@@ -181,7 +229,7 @@ class MainWindow(QMainWindow):
 
     def _setup_duration_changed_handler(self, video_start_dt: datetime) -> None:
         """Setup the duration changed signal handler."""
-        if self._video_player and hasattr(self._video_player, "_player"):
+        if self._video_player and self._video_player._player is not None:
             self._video_player._player.durationChanged.connect(
                 lambda dur: self._timeline
                 and self._timeline.set_video_timing(video_start_dt, int(dur))
@@ -207,6 +255,35 @@ class MainWindow(QMainWindow):
         super().resizeEvent(event)
 
 
+def _setup_logging() -> None:
+    """Route root logging through a queue so the UI thread never blocks on I/O.
+
+    Records are handed to a QueueListener thread; file writes are batched by a
+    MemoryHandler and flushed when full or on ERROR and above.
+    """
+    log_dir = Path.home() / ".logs" / "activity_beacon"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    log_file = log_dir / f"viewer_{datetime.now().strftime("%Y%m%d")}.log"
+    logger = logging.getLogger()
+    logger.setLevel(logging.INFO)
+    fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    fh = logging.FileHandler(str(log_file))
+    fh.setFormatter(fmt)
+    sh = logging.StreamHandler()
+    sh.setFormatter(fmt)
+    mh = logging.handlers.MemoryHandler(
+        LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=fh
+    )
+
+    q: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(q))
+    listener = logging.handlers.QueueListener(q, mh, sh, respect_handler_level=True)
+    listener.start()
+    # Stop the listener first so queued records drain, then flush the buffer
+    atexit.register(mh.close)
+    atexit.register(listener.stop)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Activity Beacon")
 
@@ -232,18 +309,7 @@ def main() -> None:
             QApplication.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
         )
 
-    log_dir = Path.home() / ".logs" / "activity_beacon"
-    log_dir.mkdir(parents=True, exist_ok=True)
-    log_file = log_dir / f"viewer_{datetime.now().strftime("%Y%m%d")}.log"
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    fmt = logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
-    fh = logging.FileHandler(str(log_file))
-    fh.setFormatter(fmt)
-    logger.addHandler(fh)
-    sh = logging.StreamHandler()
-    sh.setFormatter(fmt)
-    logger.addHandler(sh)
+    _setup_logging()
 
     base_path = Path(args.base_dir)
     if not base_path.exists() or not base_path.is_dir():
@@ -1,7 +1,9 @@
 import contextlib
+import functools
 from pathlib import Path
+import stat
 
-from PyQt6.QtCore import Qt, QUrl, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, QUrl, pyqtSignal
 from PyQt6.QtMultimedia import QAudioOutput, QMediaPlayer
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 from PyQt6.QtWidgets import (
@@ -15,6 +17,15 @@ from PyQt6.QtWidgets import (
 )
 
 MIN_ERROR_ARGS = 2
+POSITION_UPDATE_INTERVAL_MS = 100
+
+
+def _is_regular_file(path: Path) -> bool:
+    """Return True if path is a regular file, using a single stat call."""
+    try:
+        return stat.S_ISREG(path.stat().st_mode)
+    except OSError:
+        return False
 
 
 class VideoPlayerWidget(QWidget):
@@ -25,16 +36,23 @@ class VideoPlayerWidget(QWidget):
 
     def __init__(self) -> None:
         super().__init__()
-        self._player = QMediaPlayer()
-        self._audio = QAudioOutput()
-        self._player.setAudioOutput(self._audio)
+        # The media backend is expensive to start, so it is created on first load
+        self._player: QMediaPlayer | None = None
+        self._audio: QAudioOutput | None = None
+        self._volume = 1.0
         self._video = QVideoWidget()
-        self._player.setVideoOutput(self._video)
         self._video.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
         self._video.setMinimumSize(320, 240)
 
+        # positionChanged fires far more often than the UI needs; coalesce it
+        self._pending_pos: int | None = None
+        self._pos_timer = QTimer(self)
+        self._pos_timer.setSingleShot(True)
+        self._pos_timer.setInterval(POSITION_UPDATE_INTERVAL_MS)
+        self._pos_timer.timeout.connect(self._flush_pos)
+
         self._setup_widgets()
         self._setup_layout()
         self._setup_signals()
@@ -87,64 +105,101 @@ class VideoPlayerWidget(QWidget):
         self._position_slider.sliderMoved.connect(self._on_slider_moved)
         self._volume_slider.valueChanged.connect(self._on_volume_changed)
 
-        self._player.positionChanged.connect(self._on_position_changed)
-        self._player.durationChanged.connect(self._on_duration_changed)
-        self._player.playbackStateChanged.connect(self._on_playback_state_changed)
-        self._player.mediaStatusChanged.connect(self._on_media_status_changed)
+    def _ensure_player(self) -> QMediaPlayer:
+        """Create the media player and audio output on first use."""
+        if self._player is not None:
+            return self._player
+        player = QMediaPlayer()
+        self._audio = QAudioOutput()
+        self._audio.setVolume(self._volume)
+        player.setAudioOutput(self._audio)
+        player.setVideoOutput(self._video)
+
+        player.positionChanged.connect(self._on_position_changed)
+        player.durationChanged.connect(self._on_duration_changed)
+        player.playbackStateChanged.connect(self._on_playback_state_changed)
+        player.mediaStatusChanged.connect(self._on_media_status_changed)
         with contextlib.suppress(AttributeError):
-            self._player.errorOccurred.connect(self._on_error)
+            player.errorOccurred.connect(self._on_error)
+        self._player = player
+        return player
 
-    def load_video(self, video_path: Path) -> None:
-        if not video_path.exists() or not video_path.is_file():
+    def load_video(self, video_path: Path, *, skip_check: bool = False) -> None:
+        if not skip_check and not _is_regular_file(video_path):
             self._status_label.setText("Video not available")
             return
+        player = self._ensure_player()
         self._status_label.setText("")
         self.loading_changed.emit(True)  # noqa: FBT003
-        self._player.setSource(QUrl.fromLocalFile(str(video_path)))
-        self._player.setPosition(0)
+        player.setSource(QUrl.fromLocalFile(str(video_path)))
+        player.setPosition(0)
         self._position_slider.setValue(0)
 
     def play(self) -> None:
-        self._player.play()
+        if self._player is not None:
+            self._player.play()
 
     def pause(self) -> None:
-        self._player.pause()
+        if self._player is not None:
+            self._player.pause()
 
     def seek(self, position_ms: int) -> None:
-        self._player.setPosition(max(0, position_ms))
+        if self._player is not None:
+            self._player.setPosition(max(0, position_ms))
 
     def set_volume(self, volume: int) -> None:
         v = max(0, min(100, volume))
-        self._audio.setVolume(v / 100.0)
+        self._set_audio_volume(v / 100.0)
 
     def get_duration(self) -> int:
-        return int(self._player.duration())
+        return int(self._player.duration()) if self._player is not None else 0
 
     def get_position(self) -> int:
-        return int(self._player.position())
+        return int(self._player.position()) if self._player is not None else 0
+
+    def _set_audio_volume(self, volume: float) -> None:
+        self._volume = volume
+        if self._audio is not None:
+            self._audio.setVolume(volume)
 
     def _toggle_play(self) -> None:
+        if self._player is None:
+            return
         if self._player.playbackState() == QMediaPlayer.PlaybackState.PlayingState:
             self._player.pause()
         else:
             self._player.play()
 
     def _on_slider_moved(self, val: int) -> None:
-        self._player.setPosition(val)
+        if self._player is not None:
+            self._player.setPosition(val)
+        # Dragging should feel immediate, so skip the throttle
+        self._pos_timer.stop()
+        self._pending_pos = val
+        self._flush_pos()
 
     def _on_volume_changed(self, val: int) -> None:
-        self._audio.setVolume(val / 100.0)
+        self._set_audio_volume(val / 100.0)
 
     def _on_position_changed(self, pos: int) -> None:
+        self._pending_pos = pos
+        if not self._pos_timer.isActive():
+            self._pos_timer.start()
+
+    def _flush_pos(self) -> None:
+        pos = self._pending_pos
+        if pos is None:
+            return
+        self._pending_pos = None
         self._position_slider.blockSignals(True)  # noqa: FBT003
         self._position_slider.setValue(pos)
         self._position_slider.blockSignals(False)  # noqa: FBT003
         self.position_changed.emit(pos)
-        self._position_label.setText(VideoPlayerWidget._fmt_ms(pos))
+        self._position_label.setText(VideoPlayerWidget._fmt_s(max(0, pos // 1000)))
 
     def _on_duration_changed(self, dur: int) -> None:
         self._position_slider.setRange(0, dur)
-        self._duration_label.setText(VideoPlayerWidget._fmt_ms(dur))
+        self._duration_label.setText(VideoPlayerWidget._fmt_s(max(0, dur // 1000)))
 
     def _on_playback_state_changed(self, st: QMediaPlayer.PlaybackState) -> None:
         self.playback_state_changed.emit(st)
@@ -153,16 +208,14 @@ class VideoPlayerWidget(QWidget):
         )
 
     @staticmethod
-    def _fmt_ms(ms: int) -> str:
-        s = max(0, int(ms // 1000))
-        m = s // 60
-        r = s % 60
-        return f"{m:02d}:{r:02d}"
+    @functools.lru_cache(maxsize=4096)
+    def _fmt_s(s: int) -> str:
+        return f"{s // 60:02d}:{s % 60:02d}"
 
     def _on_media_status_changed(self, st: QMediaPlayer.MediaStatus) -> None:
         if st == QMediaPlayer.MediaStatus.EndOfMedia:
-            self._player.pause()
-            self._player.setPosition(0)
+            self.pause()
+            self.seek(0)
             self._position_slider.setValue(0)
         if st == QMediaPlayer.MediaStatus.InvalidMedia:
             msg = "Error loading video"
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 import json
 import logging
+import mmap
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
 
+ERROR_MALFORMED_JSON = "malformed_json"
+ERROR_INVALID_STRUCTURE = "invalid_structure"
+ERROR_INVALID_TIMESTAMP = "invalid_timestamp"
 
-@dataclass
+
+@dataclass(slots=True)
 class WindowInfo:
     app_name: str
     window_name: str
@@ -19,7 +26,7 @@ class WindowInfo:
     is_focused_window: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class WindowDataEntry:
     timestamp: datetime
     focused_app_name: str | None
@@ -49,12 +56,25 @@ class WindowDataEntry:
 
 
 class WindowDataParser:
-    def parse_file(self, file_path: Path) -> list[WindowDataEntry]:  # noqa: PLR6301
+    def parse_file(  # noqa: PLR6301
+        self,
+        file_path: Path,
+        *,
+        min_iso: str | None = None,
+        max_iso: str | None = None,
+    ) -> list[WindowDataEntry]:
+        """Parse a window data file.
+
+        Entries whose ISO timestamp string sorts outside [min_iso, max_iso] are
+        skipped before any datetime parsing.
+        """
         entries: list[WindowDataEntry] = []
         if not file_path.exists() or not file_path.is_file():
             return entries
         try:
-            return WindowDataParser._read_entries_from_file(file_path)
+            return WindowDataParser._read_entries_from_file(
+                file_path, min_iso=min_iso, max_iso=max_iso
+            )
         except PermissionError as e:
             logging.error("Permission error reading window data: %s", e)
             return []
@@ -63,36 +83,94 @@ class WindowDataParser:
             return []
 
     @staticmethod
-    def _read_entries_from_file(file_path: Path) -> list[WindowDataEntry]:
+    def _read_entries_from_file(
+        file_path: Path, *, min_iso: str | None, max_iso: str | None
+    ) -> list[WindowDataEntry]:
         """Read window data entries from a file."""
+        with file_path.open("rb") as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return []
+        with mm:
+            return WindowDataParser._parse_lines(
+                WindowDataParser._iter_lines(mm), min_iso=min_iso, max_iso=max_iso
+            )
+
+    @staticmethod
+    def _parse_lines(
+        lines: Iterable[bytes], *, min_iso: str | None, max_iso: str | None
+    ) -> list[WindowDataEntry]:
+        """Parse lines, logging one summary warning for any that were rejected."""
         entries: list[WindowDataEntry] = []
-        with file_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                entry = WindowDataParser.parse_line(line)
-                if entry is not None:
-                    entries.append(entry)
+        errors: Counter[str] = Counter()
+        for line in lines:
+            entry, error = WindowDataParser.parse_line(
+                line, min_iso=min_iso, max_iso=max_iso
+            )
+            if entry is not None:
+                entries.append(entry)
+            elif error is not None:
+                errors[error] += 1
+        if errors:
+            logging.warning("window_data parse: %s", dict(errors))
         return entries
 
     @staticmethod
-    def parse_line(line: str) -> WindowDataEntry | None:
+    def _iter_lines(mm: mmap.mmap) -> Iterator[bytes]:
+        """Yield non-empty lines from a mapped file without splitting it up front."""
+        pos = 0
+        size = len(mm)
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            if end == -1:
+                end = size
+            if end > pos:
+                yield mm[pos:end]
+            pos = end + 1
+
+    @staticmethod
+    def _in_range(ts_str: object, min_iso: str | None, max_iso: str | None) -> bool:
+        """Compare ISO-8601 strings lexicographically against optional bounds."""
+        if not isinstance(ts_str, str):
+            return True
+        if min_iso is not None and ts_str < min_iso:
+            return False
+        return max_iso is None or ts_str <= max_iso
+
+    @staticmethod
+    def parse_line(
+        line: str | bytes,
+        *,
+        min_iso: str | None = None,
+        max_iso: str | None = None,
+    ) -> tuple[WindowDataEntry | None, str | None]:
+        """Parse one JSONL line.
+
+        Accepts raw UTF-8 bytes as well as text, so callers can skip decoding.
+
+        Returns:
+            Tuple of (entry, error_kind). Both are None when the entry falls
+            outside the requested timestamp range.
+        """
         try:
             obj = json.loads(line)
-        except json.JSONDecodeError:
-            logging.warning("Malformed JSON line in window data")
-            return None
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return None, ERROR_MALFORMED_JSON
         ts_str = obj.get("timestamp")
         focused_app_name = obj.get("focused_app_name")
         focused_app_pid = obj.get("focused_app_pid")
         focused_window_name = obj.get("focused_window_name")
         windows_raw = obj.get("windows", [])
         if not ts_str or not isinstance(windows_raw, list):
-            logging.warning("Invalid window data entry structure")
-            return None
+            return None, ERROR_INVALID_STRUCTURE
+        if not WindowDataParser._in_range(ts_str, min_iso, max_iso):
+            return None, None
         try:
             ts = datetime.fromisoformat(ts_str)
         except ValueError:
-            logging.warning("Invalid timestamp in window data entry")
-            return None
+            return None, ERROR_INVALID_TIMESTAMP
         windows: list[WindowInfo] = []
         for w in windows_raw:
             app_name = w.get("app_name")
@@ -111,7 +189,7 @@ class WindowDataParser:
                     )
                 )
 
-        return WindowDataEntry(
+        entry = WindowDataEntry(
             timestamp=ts,
             focused_app_name=focused_app_name
             if isinstance(focused_app_name, str)
@@ -124,6 +202,7 @@ class WindowDataParser:
             else None,
             windows=windows,
         )
+        return entry, None
 
     @staticmethod
     def match_timestamp_to_video_position(
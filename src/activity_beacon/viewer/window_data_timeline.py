@@ -1,58 +1,125 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from array import array
+from bisect import bisect_right
+from datetime import datetime
+import functools
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, override
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
-
-from .window_data_parser import WindowDataParser
+import numpy as np
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QTableView, QVBoxLayout, QWidget
 
 if TYPE_CHECKING:
-    from datetime import datetime
+    from PyQt6.QtCore import QObject
 
     from .video_player import VideoPlayerWidget
     from .window_data_parser import WindowDataEntry
 
+CURSOR_SCAN_STEPS = 4
+
+_HEADERS = ("Time", "App", "Window")
+_ROOT = QModelIndex()
+_ITEM_FLAGS = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+_get_timestamp = attrgetter("timestamp")
+
+
+@functools.cache
+def _bold_font() -> QFont:
+    # Built lazily: QFont needs a running QGuiApplication
+    font = QFont()
+    font.setBold(True)
+    return font
+
+
+class _EntriesModel(QAbstractTableModel):
+    """Read-only table over the entry list; cells are built when the view asks."""
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._entries: list[WindowDataEntry] = []
+
+    def set_entries(self, entries: list[WindowDataEntry]) -> None:
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    @override
+    def rowCount(self, parent: QModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    @override
+    def columnCount(self, parent: QModelIndex = _ROOT) -> int:
+        return 0 if parent.isValid() else len(_HEADERS)
+
+    @override
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        return _ITEM_FLAGS
+
+    @override
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            role == Qt.ItemDataRole.DisplayRole
+            and orientation == Qt.Orientation.Horizontal
+        ):
+            return _HEADERS[section]
+        return None
+
+    @override
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role == Qt.ItemDataRole.DisplayRole:
+            e = self._entries[index.row()]
+            col = index.column()
+            if col == 0:
+                t = e.timestamp
+                return f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+            aw = e.active_window
+            if aw is None:
+                return ""
+            return aw.app_name if col == 1 else aw.window_name
+        if (
+            role == Qt.ItemDataRole.FontRole
+            and index.column()
+            and self._entries[index.row()].active_window is not None
+        ):
+            return _bold_font()
+        return None
+
 
 class WindowDataTimeline(QWidget):
     def __init__(self) -> None:
         super().__init__()
-        self._table = QTableWidget(0, 3)
-        self._table.setHorizontalHeaderLabels(["Time", "App", "Window"])
+        self._model = _EntriesModel(self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         self._table.verticalHeader().setVisible(False)
-        self._table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self._table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self._table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self._table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self._table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self._table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self._table.setShowGrid(False)
         lay = QVBoxLayout()
         lay.addWidget(self._table)
         self.setLayout(lay)
         self._entries: list[WindowDataEntry] = []
-        self._entry_positions: list[int] = []
+        self._entry_positions: array[int] = array("q")
         self._video_start: datetime | None = None
         self._video_duration_ms: int = 0
+        self._last_idx: int | None = None
+        self._cursor = 0
 
     def load_window_data(self, entries: list[WindowDataEntry]) -> None:
-        self._entries = sorted(entries, key=lambda e: e.timestamp)
-        self._table.setRowCount(len(self._entries))
-        for i, e in enumerate(self._entries):
-            t_item = QTableWidgetItem(e.timestamp.strftime("%H:%M:%S"))
-            aw = e.active_window
-            app = aw.app_name if aw else ""
-            win = aw.window_name if aw else ""
-            app_item = QTableWidgetItem(app)
-            win_item = QTableWidgetItem(win)
-            for it in (t_item, app_item, win_item):
-                it.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable)
-
-            if aw is not None:
-                font = app_item.font()
-                font.setBold(True)
-                app_item.setFont(font)
-                win_item.setFont(font)
-            self._table.setItem(i, 0, t_item)
-            self._table.setItem(i, 1, app_item)
-            self._table.setItem(i, 2, win_item)
+        self._entries = sorted(entries, key=_get_timestamp)
+        self._last_idx = None
+        self._cursor = 0
+        # Rows are materialised by the view on demand, only for visible cells
+        self._model.set_entries(self._entries)
         if self._video_start is not None:
             self._recompute_positions()
 
@@ -64,15 +131,18 @@ class WindowDataTimeline(QWidget):
         ):
             self._recompute_positions()
         idx = self._find_index_for_position(video_position_ms)
-        if idx is None:
+        if idx is None or idx == self._last_idx:
             return
+        self._last_idx = idx
         self._table.selectRow(idx)
-        self._table.scrollToItem(self._table.item(idx, 0))
+        self._table.scrollTo(self._model.index(idx, 0))
 
     def clear(self) -> None:
         self._entries = []
-        self._entry_positions = []
-        self._table.setRowCount(0)
+        self._entry_positions = array("q")
+        self._last_idx = None
+        self._cursor = 0
+        self._model.set_entries(self._entries)
         self._video_start = None
         self._video_duration_ms = 0
 
@@ -87,28 +157,40 @@ class WindowDataTimeline(QWidget):
         player.position_changed.connect(self.update_current_position)
 
     def _recompute_positions(self) -> None:
-        self._entry_positions = [
-            WindowDataParser.match_timestamp_to_video_position(
-                e.timestamp, self._video_start, self._video_duration_ms
-            )
-            for e in self._entries
-        ]
+        # Same clamping as WindowDataParser.match_timestamp_to_video_position,
+        # done in one vectorised pass. tz-aware datetimes can't go straight
+        # into datetime64, so go through epoch seconds rounded to whole
+        # microseconds, which keeps the millisecond offsets exact.
+        seconds = np.fromiter(
+            map(datetime.timestamp, map(_get_timestamp, self._entries)),
+            dtype=np.float64,
+            count=len(self._entries),
+        )
+        start_us = round(self._video_start.timestamp() * 1_000_000)
+        offsets = (np.rint(seconds * 1_000_000).astype(np.int64) - start_us) // 1000
+        np.clip(offsets, 0, self._video_duration_ms, out=offsets)
+        # Per-tick lookups use bisect, which is faster on array than on ndarray
+        positions = array("q")
+        positions.frombytes(offsets.tobytes())
+        self._entry_positions = positions
 
     def _find_index_for_position(self, pos_ms: int) -> int | None:
-        if not self._entry_positions:
+        positions = self._entry_positions
+        n = len(positions)
+        if not n:
             return None
-        lo, hi = 0, len(self._entry_positions) - 1
-        if pos_ms <= self._entry_positions[0]:
+        if n == 1:
             return 0
-        if pos_ms >= self._entry_positions[hi]:
-            return hi
-        while lo <= hi:
-            mid = (lo + hi) // 2
-            cur = self._entry_positions[mid]
-            if cur == pos_ms:
-                return mid
-            if cur < pos_ms:
-                lo = mid + 1
-            else:
-                hi = mid - 1
-        return max(0, hi)
+        # Playback mostly moves forward, so check the current entry and the
+        # next few before falling back to a binary search
+        start = self._cursor if self._cursor < n else 0
+        for i in range(start, min(start + CURSOR_SCAN_STEPS, n)):
+            if positions[i] > pos_ms:
+                break
+            if i == n - 1 or pos_ms < positions[i + 1]:
+                self._cursor = i
+                return i
+        # Last entry at or before pos_ms, clamped to the first entry
+        idx = max(0, bisect_right(positions, pos_ms) - 1)
+        self._cursor = idx
+        return idx
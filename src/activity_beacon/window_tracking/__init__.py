@@ -5,11 +5,13 @@ from activity_beacon.window_tracking.data import (
 )
 from activity_beacon.window_tracking.focus_tracker import FocusTracker
 from activity_beacon.window_tracking.window_enumerator import WindowEnumerator
+from activity_beacon.window_tracking.window_frame import WindowFrame
 
 __all__ = [
     "FocusTracker",
     "FocusedAppData",
     "WindowDataEntry",
     "WindowEnumerator",
+    "WindowFrame",
     "WindowInfo",
 ]
@@ -23,6 +23,8 @@ class FocusTracker:
         """Initialize the FocusTracker with NSWorkspace."""
         super().__init__()
         self.workspace = NSWorkspace.sharedWorkspace()  # type: ignore[no-untyped-call]
+        # Bound once; called on every capture tick
+        self._frontmost = self.workspace.frontmostApplication
         self.last_error_msg: str | None = None
 
     def get_focused_application(self) -> FocusedAppData:
@@ -37,8 +39,9 @@ class FocusTracker:
             - Window name may be None if not available or accessible
             - Timestamp is always in UTC timezone
         """
+        timestamp = datetime.now(UTC)
         try:
-            active_app = self.workspace.frontmostApplication()  # type: ignore[no-untyped-call]
+            active_app = self._frontmost()  # type: ignore[no-untyped-call]
 
             if not active_app:
                 # Return placeholder if no active application
@@ -46,7 +49,7 @@ class FocusTracker:
                     app_name="Unknown",
                     pid=0,
                     window_name=None,
-                    timestamp=datetime.now(UTC),
+                    timestamp=timestamp,
                 )
 
             app_name = cast("str", active_app.localizedName() or "Unknown")  # type: ignore[no-untyped-call]
@@ -61,7 +64,7 @@ class FocusTracker:
                 app_name=app_name,
                 pid=pid,
                 window_name=window_name,
-                timestamp=datetime.now(UTC),
+                timestamp=timestamp,
             )
 
         except RuntimeError as e:
@@ -72,7 +75,7 @@ class FocusTracker:
                 app_name="Unknown",
                 pid=0,
                 window_name=None,
-                timestamp=datetime.now(UTC),
+                timestamp=timestamp,
             )
 
     @staticmethod
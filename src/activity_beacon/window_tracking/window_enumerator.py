@@ -12,6 +12,21 @@ if TYPE_CHECKING:
 
 logger = get_logger("activity_beacon.window_tracking")
 
+# Quartz window dictionary keys, resolved once at import
+# We use cast and type: ignore to handle missing type stubs for Quartz
+_K_LAYER = cast("str", Quartz.kCGWindowLayer)  # type: ignore[attr-defined]
+_K_OWNER_NAME = cast("str", Quartz.kCGWindowOwnerName)  # type: ignore[attr-defined]
+_K_NAME = cast("str", Quartz.kCGWindowName)  # type: ignore[attr-defined]
+_K_OWNER_PID = cast("str", Quartz.kCGWindowOwnerPID)  # type: ignore[attr-defined]
+_K_BOUNDS = cast("str", Quartz.kCGWindowBounds)  # type: ignore[attr-defined]
+
+# Options for window list: on-screen only, exclude desktop elements
+_LIST_OPTIONS: int = (
+    Quartz.kCGWindowListOptionOnScreenOnly  # type: ignore[attr-defined]
+    | Quartz.kCGWindowListExcludeDesktopElements  # type: ignore[attr-defined]
+)
+_NULL_WINDOW_ID: int = Quartz.kCGNullWindowID  # type: ignore[attr-defined]
+
 
 class WindowEnumerator:
     """Enumerates all visible windows using Quartz Window Services.
@@ -21,13 +36,12 @@ class WindowEnumerator:
     process IDs, and geometry.
     """
 
-    # Quartz keys cached as class constants to avoid repeated casting and reduce local variables
-    # We use cast and type: ignore to handle missing type stubs for Quartz
-    K_LAYER = cast("str", Quartz.kCGWindowLayer)  # type: ignore[attr-defined]
-    K_OWNER_NAME = cast("str", Quartz.kCGWindowOwnerName)  # type: ignore[attr-defined]
-    K_NAME = cast("str", Quartz.kCGWindowName)  # type: ignore[attr-defined]
-    K_OWNER_PID = cast("str", Quartz.kCGWindowOwnerPID)  # type: ignore[attr-defined]
-    K_BOUNDS = cast("str", Quartz.kCGWindowBounds)  # type: ignore[attr-defined]
+    # Kept for callers that read the Quartz keys off the class
+    K_LAYER = _K_LAYER
+    K_OWNER_NAME = _K_OWNER_NAME
+    K_NAME = _K_NAME
+    K_OWNER_PID = _K_OWNER_PID
+    K_BOUNDS = _K_BOUNDS
 
     def __init__(self) -> None:
         """Initialize the WindowEnumerator."""
@@ -46,35 +60,36 @@ class WindowEnumerator:
         Returns:
             tuple[WindowInfo, ...]: A tuple of WindowInfo objects for each visible window.
         """
-        try:
-            # Options for window list: on-screen only, exclude desktop elements
-            # PyObjC constants are often not recognized by static analyzers
-            k_on_screen = cast("int", Quartz.kCGWindowListOptionOnScreenOnly)  # type: ignore[attr-defined]
-            k_exclude_desktop = cast("int", Quartz.kCGWindowListExcludeDesktopElements)  # type: ignore[attr-defined]
-            k_null_id = cast("int", Quartz.kCGNullWindowID)  # type: ignore[attr-defined]
+        k_layer = _K_LAYER
+        k_owner_name = _K_OWNER_NAME
+        k_name = _K_NAME
+        k_owner_pid = _K_OWNER_PID
+        k_bounds = _K_BOUNDS
 
-            list_options = k_on_screen | k_exclude_desktop
-
-            # Get the window list information
+        try:
             # Using cast to Mapping for basedpyright
             window_list = cast(
                 "list[Mapping[str, object]]",
-                Quartz.CGWindowListCopyWindowInfo(list_options, k_null_id),
+                Quartz.CGWindowListCopyWindowInfo(_LIST_OPTIONS, _NULL_WINDOW_ID),
             )  # type: ignore[no-untyped-call]
 
             if not window_list:
                 return ()
 
-            windows: list[WindowInfo] = []
-            for window_data in window_list:
-                # Skip windows with layer > 0 (usually system overlays, menus, etc.)
-                layer = cast("int", window_data.get(self.K_LAYER, 0))
-                if layer != 0:
-                    continue
-
-                windows.append(self._parse_window_data(window_data, focused_pid))
-
-            return tuple(windows)
+            # Skip windows with layer > 0 (usually system overlays, menus, etc.)
+            return tuple(
+                WindowInfo(
+                    window_name=cast("str", window_data.get(k_name, "")),
+                    app_name=cast("str", window_data.get(k_owner_name, "Unknown")),
+                    pid=(pid := cast("int", window_data.get(k_owner_pid, 0))),
+                    is_focused=focused_pid is not None and pid == focused_pid,
+                    screen_rect=self._bounds_to_rect(
+                        cast("Mapping[str, float] | None", window_data.get(k_bounds))
+                    ),
+                )
+                for window_data in window_list
+                if window_data.get(k_layer, 0) == 0
+            )
 
         except RuntimeError as e:
             error_msg = f"Failed to enumerate windows: {e}"
@@ -82,40 +97,23 @@ class WindowEnumerator:
             self.last_error_msg = error_msg
             return ()
 
-    def _parse_window_data(
-        self,
-        window_data: "Mapping[str, object]",
-        focused_pid: int | None,
-    ) -> WindowInfo:
-        """Parse individual window data dictionary into WindowInfo.
+    @staticmethod
+    def _bounds_to_rect(
+        bounds: "Mapping[str, float] | None",
+    ) -> tuple[int, int, int, int]:
+        """Convert a Quartz window bounds dictionary to an (x, y, w, h) tuple.
 
         Args:
-            window_data: Raw window data from Quartz.
-            focused_pid: PID of the focused application.
+            bounds: Raw kCGWindowBounds value, if present.
 
         Returns:
-            WindowInfo: Structured window information.
+            tuple[int, int, int, int]: Window geometry, or zeros if unavailable.
         """
-        app_name = cast("str", window_data.get(self.K_OWNER_NAME, "Unknown"))
-        window_name = cast("str", window_data.get(self.K_NAME, ""))
-        pid = cast("int", window_data.get(self.K_OWNER_PID, 0))
-
-        # Extract window bounds (geometry)
-        bounds = cast("Mapping[str, float] | None", window_data.get(self.K_BOUNDS))
-        if bounds:
-            rect = (
-                int(bounds.get("X", 0.0)),
-                int(bounds.get("Y", 0.0)),
-                int(bounds.get("Width", 0.0)),
-                int(bounds.get("Height", 0.0)),
-            )
-        else:
-            rect = (0, 0, 0, 0)
-
-        return WindowInfo(
-            window_name=window_name,
-            app_name=app_name,
-            pid=pid,
-            is_focused=focused_pid is not None and pid == focused_pid,
-            screen_rect=rect,
+        if not bounds:
+            return (0, 0, 0, 0)
+        return (
+            int(bounds.get("X", 0.0)),
+            int(bounds.get("Y", 0.0)),
+            int(bounds.get("Width", 0.0)),
+            int(bounds.get("Height", 0.0)),
         )
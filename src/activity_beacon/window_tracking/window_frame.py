@@ -0,0 +1,70 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from activity_beacon.window_tracking.data import WindowInfo
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class WindowFrame:
+    """Column-oriented view of a set of windows.
+
+    Holds one parallel column per WindowInfo field so that consumers scanning
+    a single attribute don't have to walk a tuple of objects. Build one from
+    enumerated windows with
+    ``WindowFrame.from_windows(enumerator.enumerate_windows(focused_pid))``.
+    """
+
+    window_names: tuple[str, ...]
+    app_names: tuple[str, ...]
+    pids: tuple[int, ...]
+    is_focused_mask: npt.NDArray[np.bool_]
+    rects: npt.NDArray[np.int32]
+
+    @classmethod
+    def from_windows(cls, windows: Iterable[WindowInfo]) -> "WindowFrame":
+        """Build a frame from WindowInfo records.
+
+        Args:
+            windows: Windows in the order their rows should appear.
+
+        Returns:
+            WindowFrame: One column per WindowInfo field; rects has shape (N, 4)
+                even when there are no windows.
+        """
+        windows = tuple(windows)
+        return cls(
+            window_names=tuple(w.window_name for w in windows),
+            app_names=tuple(w.app_name for w in windows),
+            pids=tuple(w.pid for w in windows),
+            is_focused_mask=np.array([w.is_focused for w in windows], dtype=np.bool_),
+            rects=np.array([w.screen_rect for w in windows], dtype=np.int32).reshape(
+                -1, 4
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.pids)
+
+    @property
+    def all_windows(self) -> tuple[WindowInfo, ...]:
+        """Materialize the columns back into WindowInfo objects."""
+        return tuple(
+            WindowInfo(
+                window_name=name,
+                app_name=app,
+                pid=pid,
+                is_focused=bool(focused),
+                screen_rect=(int(x), int(y), int(w), int(h)),
+            )
+            for name, app, pid, focused, (x, y, w, h) in zip(
+                self.window_names,
+                self.app_names,
+                self.pids,
+                self.is_focused_mask,
+                self.rects,
+                strict=True,
+            )
+        )
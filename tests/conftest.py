@@ -1,46 +1,80 @@
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterable
 from datetime import datetime
+import functools
 import logging
+import os
 from pathlib import Path
+import sys
+from typing import cast
+from unittest.mock import MagicMock, create_autospec
 
+import numpy as np
+from PIL import Image
+from PyQt6.QtWidgets import QApplication
 import pytest
 
+from activity_beacon.file_storage.date_directory_manager import DateDirectoryManager
+from activity_beacon.screenshot.capture import ScreenshotCapture
+from activity_beacon.screenshot.change_detector import ChangeDetector
+from activity_beacon.screenshot.image_processor import ImageProcessor
+from activity_beacon.system_state.system_state_monitor import SystemStateMonitor
 from activity_beacon.window_tracking.data import (
     FocusedAppData,
     WindowDataEntry,
     WindowInfo,
 )
+from activity_beacon.window_tracking.focus_tracker import FocusTracker
+from activity_beacon.window_tracking.window_enumerator import WindowEnumerator
 
 
-@pytest.fixture(autouse=True)
-def clear_logger_cache() -> Generator[None, None, None]:
-    """Clear the logger cache before and after each test to prevent test interference."""
+def pytest_configure(config: pytest.Config) -> None:
+    """Root tmp_path on tmpfs when ACTIVITY_BEACON_TEST_TMPFS is set.
+
+    Only the temp root moves, so pytest still hands out numbered, locked
+    basetemp directories and concurrent runs don't clobber each other.
+    """
+    shm = Path("/dev/shm")  # noqa: S108
+    if (
+        os.environ.get("ACTIVITY_BEACON_TEST_TMPFS")
+        and "PYTEST_DEBUG_TEMPROOT" not in os.environ
+        and not config.option.basetemp
+        and sys.platform == "linux"
+        and shm.is_dir()
+    ):
+        os.environ["PYTEST_DEBUG_TEMPROOT"] = str(shm)
+
+
+def _reset_registered_loggers() -> None:
     from activity_beacon import logging as ab_logging
 
     ab_logging.COMPONENT_LOGGERS.clear()
+    for logger_name in ab_logging.REGISTERED_LOGGER_NAMES:
+        logger = logging.getLogger(logger_name)
+        # Close all handlers before clearing
+        for handler in logger.handlers[:]:
+            handler.close()
+            logger.removeHandler(handler)
+        logger.propagate = True
+    ab_logging.REGISTERED_LOGGER_NAMES.clear()
 
-    # Also clear Python's logging module loggers
-    for logger_name in list(logging.Logger.manager.loggerDict.keys()):
-        if logger_name.startswith("activity_beacon") or logger_name.startswith("test_"):
-            logger = logging.getLogger(logger_name)
-            # Close all handlers before clearing
-            for handler in logger.handlers[:]:
-                handler.close()
-                logger.removeHandler(handler)
-            logger.propagate = True
 
+@pytest.fixture(autouse=True)
+def clear_logger_cache() -> Generator[None, None, None]:
+    """Clear the logger cache before and after each test to prevent test interference."""
+    _reset_registered_loggers()
     yield
+    _reset_registered_loggers()
 
-    # Clean up after test
-    ab_logging.COMPONENT_LOGGERS.clear()
-    for logger_name in list(logging.Logger.manager.loggerDict.keys()):
-        if logger_name.startswith("activity_beacon") or logger_name.startswith("test_"):
-            logger = logging.getLogger(logger_name)
-            # Close all handlers before clearing
-            for handler in logger.handlers[:]:
-                handler.close()
-                logger.removeHandler(handler)
-            logger.propagate = True
+
+@pytest.fixture(scope="session")
+def qapp() -> QApplication:
+    """Return the process-wide QApplication, creating it on first use."""
+    app = QApplication.instance()
+    if app is None:
+        # No windows are shown, so don't require a display
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        app = QApplication([])
+    return cast("QApplication", app)
 
 
 @pytest.fixture
@@ -50,7 +84,7 @@ def temp_log_dir(tmp_path: Path) -> Generator[Path, None, None]:
     yield log_dir
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_window_info() -> WindowInfo:
     return WindowInfo(
         window_name="Test Window",
@@ -61,7 +95,7 @@ def sample_window_info() -> WindowInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_focused_app_data() -> FocusedAppData:
     return FocusedAppData(
         app_name="Safari",
@@ -71,7 +105,7 @@ def sample_focused_app_data() -> FocusedAppData:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_window_data_entry(
     sample_focused_app_data: FocusedAppData, sample_window_info: WindowInfo
 ) -> WindowDataEntry:
@@ -88,3 +122,143 @@ def mock_screenshot_dir(tmp_path: Path) -> Generator[Path, None, None]:
     year_dir = tmp_path / "2024" / "01" / "15"
     year_dir.mkdir(parents=True)
     yield tmp_path
+
+
+@pytest.fixture(scope="session")
+def touch_files() -> Callable[[Path, Iterable[str]], None]:
+    """Return a helper that creates empty files under a directory.
+
+    Uses a bare open/close instead of Path.touch, which also calls utime.
+    """
+
+    def touch(parent: Path, names: Iterable[str]) -> None:
+        for name in names:
+            os.close(os.open(parent / name, os.O_CREAT | os.O_WRONLY, 0o644))
+
+    return touch
+
+
+@pytest.fixture(scope="session")
+def make_date_dir() -> Callable[[Path, datetime], Path]:
+    """Return a helper that creates the YYYY/MM/DD directory for a date."""
+
+    def make(base: Path, date: datetime) -> Path:
+        date_dir = base / f"{date:%Y}" / f"{date:%m}" / f"{date:%d}"
+        os.makedirs(date_dir, exist_ok=True)  # noqa: PTH103
+        return date_dir
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def solid_image_factory() -> Callable[[int, int, tuple[int, int, int]], Image.Image]:
+    """Return a builder for solid-color RGB images, memoised for the session.
+
+    The same instance is handed to every caller, so tests must only read it.
+    The cache is bounded so large composites don't stay pinned all session.
+    """
+
+    @functools.lru_cache(maxsize=32)
+    def make(width: int, height: int, color: tuple[int, int, int]) -> Image.Image:
+        arr = np.empty((height, width, 3), dtype=np.uint8)
+        arr[...] = color
+        return Image.fromarray(arr)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def solid_array_factory() -> Callable[[int, int, tuple[int, int, int]], np.ndarray]:
+    """Return a builder for read-only solid-color RGB pixel arrays.
+
+    Lets comparison tests skip the PIL round trip entirely.
+    """
+
+    @functools.lru_cache(maxsize=32)
+    def make(width: int, height: int, color: tuple[int, int, int]) -> np.ndarray:
+        arr = np.empty((height, width, 3), dtype=np.uint8)
+        arr[...] = color
+        arr.setflags(write=False)
+        return arr
+
+    return make
+
+
+# Session-wide component instances. last_error_msg is never reset on success,
+# so only inject these into tests that cannot drive the instance into an
+# error path; tests exercising failures construct their own.
+
+
+@pytest.fixture(scope="session")
+def screenshot_capture() -> ScreenshotCapture:
+    return ScreenshotCapture()
+
+
+@pytest.fixture(scope="session")
+def image_processor() -> ImageProcessor:
+    return ImageProcessor()
+
+
+@pytest.fixture(scope="session")
+def focus_tracker() -> FocusTracker:
+    return FocusTracker()
+
+
+@pytest.fixture(scope="session")
+def window_enumerator() -> WindowEnumerator:
+    return WindowEnumerator()
+
+
+@pytest.fixture(scope="session")
+def system_state_monitor() -> SystemStateMonitor:
+    return SystemStateMonitor()
+
+
+# Session-wide autospec'd component mocks. Autospeccing introspects the whole
+# class, so each spec is built once; tests take them through fresh_mock.
+
+
+@pytest.fixture(scope="session")
+def fresh_mock() -> Callable[[MagicMock], MagicMock]:
+    """Return a helper that resets a template mock for the current test."""
+
+    def fresh(template: MagicMock) -> MagicMock:
+        template.reset_mock(return_value=True, side_effect=True)
+        return template
+
+    return fresh
+
+
+@pytest.fixture(scope="session")
+def screenshot_capture_template() -> MagicMock:
+    return create_autospec(ScreenshotCapture, instance=True, spec_set=True)
+
+
+@pytest.fixture(scope="session")
+def image_processor_template() -> MagicMock:
+    return create_autospec(ImageProcessor, instance=True, spec_set=True)
+
+
+@pytest.fixture(scope="session")
+def change_detector_template() -> MagicMock:
+    return create_autospec(ChangeDetector, instance=True, spec_set=True)
+
+
+@pytest.fixture(scope="session")
+def focus_tracker_template() -> MagicMock:
+    return create_autospec(FocusTracker, instance=True, spec_set=True)
+
+
+@pytest.fixture(scope="session")
+def window_enumerator_template() -> MagicMock:
+    return create_autospec(WindowEnumerator, instance=True, spec_set=True)
+
+
+@pytest.fixture(scope="session")
+def date_directory_manager_template() -> MagicMock:
+    return create_autospec(DateDirectoryManager, instance=True, spec_set=True)
+
+
+@pytest.fixture(scope="session")
+def system_state_monitor_template() -> MagicMock:
+    return create_autospec(SystemStateMonitor, instance=True, spec_set=True)
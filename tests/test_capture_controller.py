@@ -1,6 +1,6 @@
 """Tests for CaptureController."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import cast
@@ -10,25 +10,57 @@ from PIL import Image
 import pytest
 
 from activity_beacon.daemon.capture_controller import CaptureConfig, CaptureController
-from activity_beacon.file_storage.date_directory_manager import DateDirectoryManager
-from activity_beacon.screenshot.capture import MonitorInfo, ScreenshotCapture
-from activity_beacon.screenshot.change_detector import ChangeDetector
-from activity_beacon.screenshot.image_processor import ImageProcessor
-from activity_beacon.system_state.system_state_monitor import SystemStateMonitor
+from activity_beacon.screenshot.capture import MonitorInfo
 from activity_beacon.window_tracking.data import FocusedAppData, WindowInfo
-from activity_beacon.window_tracking.focus_tracker import FocusTracker
-from activity_beacon.window_tracking.window_enumerator import WindowEnumerator
 
-
-@pytest.fixture
-def temp_output_dir(tmp_path: Path) -> Generator[Path, None, None]:
+FreshMock = Callable[[MagicMock], MagicMock]
+
+# Fixed capture time for the canned payloads; no test depends on the clock
+_FIXED_TS = datetime(2024, 1, 15, 10, 30, 0, tzinfo=UTC)
+
+_MONITORS = (
+    MonitorInfo(
+        monitor_id=1,
+        name="Monitor 1",
+        x=0,
+        y=0,
+        width=1920,
+        height=1080,
+        is_primary=True,
+    ),
+)
+_WINDOWS = (
+    WindowInfo(
+        window_name="Test Window",
+        app_name="Test App",
+        pid=12345,
+        is_focused=True,
+        screen_rect=(0, 0, 1920, 1080),
+    ),
+)
+_FOCUSED_APP = FocusedAppData(
+    app_name="Safari",
+    pid=12345,
+    window_name="Test Page",
+    timestamp=_FIXED_TS,
+)
+
+
+@pytest.fixture(scope="module")
+def temp_output_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
     """Create a temporary output directory for captures."""
-    output_dir = tmp_path / "captures"
-    output_dir.mkdir()
-    yield output_dir
+    return tmp_path_factory.mktemp("captures")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def date_dir(temp_output_dir: Path) -> Path:
+    """Create the dated capture directory handed out by the mock manager."""
+    path = temp_output_dir / f"{_FIXED_TS:%Y}" / f"{_FIXED_TS:%m}" / f"{_FIXED_TS:%d}"
+    path.mkdir(parents=True)
+    return path
+
+
+@pytest.fixture(scope="module")
 def capture_config(temp_output_dir: Path) -> CaptureConfig:
     """Create a capture configuration for testing."""
     return CaptureConfig(
@@ -39,91 +71,106 @@ def capture_config(temp_output_dir: Path) -> CaptureConfig:
     )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def stub_pil_save() -> Generator[None, None, None]:
+    """Keep the capture path from encoding and writing PNGs."""
+    with patch.object(Image.Image, "save", return_value=None):
+        yield
+
+
+@pytest.fixture(scope="session")
+def blue_1080p() -> Image.Image:
+    return Image.new("RGB", (1920, 1080), color="blue")
+
+
+@pytest.fixture(scope="session")
+def green_1080p() -> Image.Image:
+    return Image.new("RGB", (1920, 1080), color="green")
+
+
+@pytest.fixture(scope="session")
+def small_rgb() -> Image.Image:
+    return Image.new("RGB", (1, 1))
+
+
 @pytest.fixture
-def mock_screenshot_capture() -> MagicMock:
+def mock_screenshot_capture(
+    screenshot_capture_template: MagicMock,
+    fresh_mock: FreshMock,
+    blue_1080p: Image.Image,
+) -> MagicMock:
     """Create a mock ScreenshotCapture."""
-    mock = MagicMock(spec=ScreenshotCapture)
-    mock.enumerate_monitors.return_value = [
-        MonitorInfo(
-            monitor_id=1,
-            name="Monitor 1",
-            x=0,
-            y=0,
-            width=1920,
-            height=1080,
-            is_primary=True,
-        ),
-    ]
-    mock.capture_all_monitors.return_value = {
-        1: Image.new("RGB", (1920, 1080), color="blue")
-    }
+    mock = fresh_mock(screenshot_capture_template)
+    mock.enumerate_monitors.return_value = list(_MONITORS)
+    mock.capture_all_monitors.return_value = {1: blue_1080p}
     return mock
 
 
 @pytest.fixture
-def mock_image_processor() -> MagicMock:
+def mock_image_processor(
+    image_processor_template: MagicMock,
+    fresh_mock: FreshMock,
+    green_1080p: Image.Image,
+) -> MagicMock:
     """Create a mock ImageProcessor."""
-    mock = MagicMock(spec=ImageProcessor)
-    mock.stitch_horizontally.return_value = Image.new(
-        "RGB", (1920, 1080), color="green"
-    )
+    mock = fresh_mock(image_processor_template)
+    mock.stitch_horizontally.return_value = green_1080p
     return mock
 
 
 @pytest.fixture
-def mock_change_detector() -> MagicMock:
+def mock_change_detector(
+    change_detector_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock ChangeDetector."""
-    mock = MagicMock(spec=ChangeDetector)
+    mock = fresh_mock(change_detector_template)
     mock.has_changed.return_value = True
     return mock
 
 
 @pytest.fixture
-def mock_focus_tracker() -> MagicMock:
+def mock_focus_tracker(
+    focus_tracker_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock FocusTracker."""
-    mock = MagicMock(spec=FocusTracker)
-    mock.get_focused_application.return_value = FocusedAppData(
-        app_name="Safari",
-        pid=12345,
-        window_name="Test Page",
-        timestamp=datetime.now(UTC),
-    )
+    mock = fresh_mock(focus_tracker_template)
+    mock.get_focused_application.return_value = _FOCUSED_APP
     return mock
 
 
 @pytest.fixture
-def mock_window_enumerator() -> MagicMock:
+def mock_window_enumerator(
+    window_enumerator_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock WindowEnumerator."""
-    mock = MagicMock(spec=WindowEnumerator)
-    mock.enumerate_windows.return_value = (
-        WindowInfo(
-            window_name="Test Window",
-            app_name="Test App",
-            pid=12345,
-            is_focused=True,
-            screen_rect=(0, 0, 1920, 1080),
-        ),
-    )
+    mock = fresh_mock(window_enumerator_template)
+    mock.enumerate_windows.return_value = _WINDOWS
     return mock
 
 
 @pytest.fixture
 def mock_date_directory_manager(
-    tmp_path: Path,
-) -> Generator[MagicMock, None, None]:
+    date_dir: Path,
+    date_directory_manager_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock DateDirectoryManager."""
-    mock = MagicMock(spec=DateDirectoryManager)
-    date_dir = tmp_path / "captures" / "2024" / "01" / "15"
-    date_dir.mkdir(parents=True)
+    mock = fresh_mock(date_directory_manager_template)
     mock.ensure_date_directory.return_value = date_dir
-    mock.get_screenshot_path.return_value = date_dir / "20240115_103000.png"
+    mock.get_screenshot_path.return_value = date_dir / f"{_FIXED_TS:%Y%m%d_%H%M%S}.png"
     return mock
 
 
 @pytest.fixture
-def mock_system_state_monitor() -> MagicMock:
+def mock_system_state_monitor(
+    system_state_monitor_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock SystemStateMonitor."""
-    mock = MagicMock(spec=SystemStateMonitor)
+    mock = fresh_mock(system_state_monitor_template)
     mock.is_screen_locked.return_value = False
     mock.check_and_notify.return_value = False
     mock.get_state_description.return_value = "unlocked"
@@ -131,8 +178,7 @@ def mock_system_state_monitor() -> MagicMock:
 
 
 @pytest.fixture
-def controller(  # noqa: PLR0917
-    capture_config: CaptureConfig,
+def mock_bundle(  # noqa: PLR0917
     mock_screenshot_capture: MagicMock,
     mock_image_processor: MagicMock,
     mock_change_detector: MagicMock,
@@ -140,16 +186,58 @@ def controller(  # noqa: PLR0917
     mock_window_enumerator: MagicMock,
     mock_date_directory_manager: MagicMock,
     mock_system_state_monitor: MagicMock,
-) -> CaptureController:
+) -> dict[str, MagicMock]:
+    """Collect the mocked components as CaptureController keyword arguments."""
+    return {
+        "screenshot_capture": mock_screenshot_capture,
+        "image_processor": mock_image_processor,
+        "change_detector": mock_change_detector,
+        "focus_tracker": mock_focus_tracker,
+        "window_enumerator": mock_window_enumerator,
+        "date_directory_manager": mock_date_directory_manager,
+        "system_state_monitor": mock_system_state_monitor,
+    }
+
+
+@pytest.fixture
+def controller(
+    capture_config: CaptureConfig,
+    mock_bundle: dict[str, MagicMock],
+) -> Generator[CaptureController, None, None]:
     """Create a CaptureController with mocked dependencies."""
+    controller = CaptureController(config=capture_config, **mock_bundle)
+    yield controller
+    # The mocks are shared session templates, so don't leave a capture
+    # thread running into the next test
+    if controller.is_running:
+        controller.stop()
+
+
+@pytest.fixture
+def controller_running(
+    controller: CaptureController,
+) -> Generator[CaptureController, None, None]:
+    """Provide the mocked controller already started."""
+    controller.start()
+    yield controller
+    if controller.is_running:
+        controller.stop()
+
+
+@pytest.fixture
+def controller_minimal(
+    capture_config: CaptureConfig,
+    mock_screenshot_capture: MagicMock,
+    mock_system_state_monitor: MagicMock,
+) -> CaptureController:
+    """Create a CaptureController for tests that never run a capture.
+
+    Only the components touched outside the capture path are mocked; the
+    rest are the real, inert defaults.
+    """
     return CaptureController(
         config=capture_config,
         screenshot_capture=mock_screenshot_capture,
-        image_processor=mock_image_processor,
-        change_detector=mock_change_detector,
-        focus_tracker=mock_focus_tracker,
-        window_enumerator=mock_window_enumerator,
-        date_directory_manager=mock_date_directory_manager,
         system_state_monitor=mock_system_state_monitor,
     )
 
@@ -201,79 +289,75 @@ class TestCaptureControllerInit:
 class TestCaptureControllerProperties:
     """Tests for CaptureController properties."""
 
-    def test_last_error_msg_initially_none(self, controller: CaptureController) -> None:
+    def test_last_error_msg_initially_none(
+        self, controller_minimal: CaptureController
+    ) -> None:
         """Test that last_error_msg is initially None."""
-        assert controller.last_error_msg is None
+        assert controller_minimal.last_error_msg is None
 
-    def test_is_running_initially_false(self, controller: CaptureController) -> None:
+    def test_is_running_initially_false(
+        self, controller_minimal: CaptureController
+    ) -> None:
         """Test that is_running is initially False."""
-        assert controller.is_running is False
+        assert controller_minimal.is_running is False
 
-    def test_is_paused_initially_false(self, controller: CaptureController) -> None:
+    def test_is_paused_initially_false(
+        self, controller_minimal: CaptureController
+    ) -> None:
         """Test that is_paused is initially False."""
-        assert controller.is_paused is False
+        assert controller_minimal.is_paused is False
 
-    def test_capture_count_initially_zero(self, controller: CaptureController) -> None:
+    def test_capture_count_initially_zero(
+        self, controller_minimal: CaptureController
+    ) -> None:
         """Test that capture_count is initially 0."""
-        assert controller.capture_count == 0
+        assert controller_minimal.capture_count == 0
 
 
 class TestCaptureControllerCallbacks:
     """Tests for CaptureController callback management."""
 
-    def test_add_on_start_callback(self, controller: CaptureController) -> None:
-        """Test adding start callbacks."""
-        callback = MagicMock()
-        controller.add_on_start_callback(callback)
-
-        assert callback in controller._on_start_callbacks
-
-    def test_add_on_stop_callback(self, controller: CaptureController) -> None:
-        """Test adding stop callbacks."""
-        callback = MagicMock()
-        controller.add_on_stop_callback(callback)
-
-        assert callback in controller._on_stop_callbacks
-
-    def test_add_on_capture_callback(self, controller: CaptureController) -> None:
-        """Test adding capture callbacks."""
-        callback = MagicMock()
-        controller.add_on_capture_callback(callback)
-
-        assert callback in controller._on_capture_callbacks
-
-    def test_add_on_pause_callback(self, controller: CaptureController) -> None:
-        """Test adding pause callbacks."""
-        callback = MagicMock()
-        controller.add_on_pause_callback(callback)
-
-        assert callback in controller._on_pause_callbacks
-
-    def test_add_on_resume_callback(self, controller: CaptureController) -> None:
-        """Test adding resume callbacks."""
+    @pytest.mark.parametrize(
+        ("method", "attr"),
+        [
+            ("add_on_start_callback", "_on_start_callbacks"),
+            ("add_on_stop_callback", "_on_stop_callbacks"),
+            ("add_on_capture_callback", "_on_capture_callbacks"),
+            ("add_on_pause_callback", "_on_pause_callbacks"),
+            ("add_on_resume_callback", "_on_resume_callbacks"),
+        ],
+    )
+    def test_add_callback(
+        self, controller_minimal: CaptureController, method: str, attr: str
+    ) -> None:
+        """Test adding each kind of callback."""
         callback = MagicMock()
-        controller.add_on_resume_callback(callback)
+        getattr(controller_minimal, method)(callback)
 
-        assert callback in controller._on_resume_callbacks
+        assert callback in getattr(controller_minimal, attr)
 
 
 class TestCaptureControllerCaptureInterval:
     """Tests for capture interval management."""
 
-    def test_set_capture_interval_valid(self, controller: CaptureController) -> None:
-        """Test setting a valid capture interval."""
-        controller.set_capture_interval(120)
-        assert controller.capture_interval_seconds == 120
-
-    def test_set_capture_interval_invalid(self, controller: CaptureController) -> None:
-        """Test setting an invalid capture interval."""
-        with pytest.raises(ValueError, match="must be positive"):
-            controller.set_capture_interval(-10)
-
-    def test_set_capture_interval_zero(self, controller: CaptureController) -> None:
-        """Test setting a zero capture interval."""
-        with pytest.raises(ValueError, match="must be positive"):
-            controller.set_capture_interval(0)
+    @pytest.mark.parametrize(
+        ("seconds", "error_match"),
+        [(120, None), (-10, "must be positive"), (0, "must be positive")],
+        ids=["valid", "negative", "zero"],
+    )
+    def test_set_capture_interval(
+        self,
+        controller_minimal: CaptureController,
+        seconds: int,
+        error_match: str | None,
+    ) -> None:
+        """Test setting valid and invalid capture intervals."""
+        if error_match is None:
+            controller_minimal.set_capture_interval(seconds)
+            assert controller_minimal.capture_interval_seconds == seconds
+        else:
+            with pytest.raises(ValueError, match=error_match):
+                controller_minimal.set_capture_interval(seconds)
 
 
 class TestCaptureControllerLifecycle:
@@ -311,16 +395,16 @@ class TestCaptureControllerLifecycle:
 
     def test_stop_running(
         self,
-        controller: CaptureController,
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
+        controller_running: CaptureController,
     ) -> None:
         """Test stopping the controller when running."""
-        controller.start()
-        mock_screenshot_capture = cast("MagicMock", controller._screenshot_capture)
+        mock_screenshot_capture = cast(
+            "MagicMock", controller_running._screenshot_capture
+        )
 
-        controller.stop()
+        controller_running.stop()
 
-        assert controller.is_running is False
+        assert controller_running.is_running is False
         mock_screenshot_capture.close.assert_called_once()
 
 
@@ -330,7 +414,6 @@ class TestCaptureControllerScreenLock:
     def test_pause_on_screen_lock(
         self,
         controller: CaptureController,
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
     ) -> None:
         """Test pause callback is triggered on screen lock."""
         pause_callback = MagicMock()
@@ -344,7 +427,6 @@ class TestCaptureControllerScreenLock:
     def test_resume_on_screen_unlock(
         self,
         controller: CaptureController,
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
     ) -> None:
         """Test resume callback is triggered on screen unlock."""
         controller._is_paused = True
@@ -360,93 +442,67 @@ class TestCaptureControllerScreenLock:
 class TestCaptureControllerPerformCapture:
     """Tests for the capture operation."""
 
-    def test_perform_capture_success(  # noqa: PLR0917
+    pytestmark = pytest.mark.slow
+
+    def test_perform_capture_success(
         self,
         controller: CaptureController,
         mock_screenshot_capture: MagicMock,
         mock_image_processor: MagicMock,
-        mock_change_detector: MagicMock,  # noqa: ARG002
         mock_focus_tracker: MagicMock,
         mock_window_enumerator: MagicMock,
-        mock_date_directory_manager: MagicMock,  # noqa: ARG002
-        tmp_path: Path,  # noqa: ARG002
     ) -> None:
         """Test successful capture operation."""
-        with patch.object(Image.Image, "save") as mock_save:
-            mock_save.return_value = None
-            controller._perform_capture()
-
-            assert controller.capture_count == 1
-            mock_screenshot_capture.capture_all_monitors.assert_called_once()
-            mock_image_processor.stitch_horizontally.assert_called_once()
-            mock_focus_tracker.get_focused_application.assert_called_once()
-            mock_window_enumerator.enumerate_windows.assert_called_once()
-
-    def test_perform_capture_with_change_detection(  # noqa: PLR0917
-        self,
-        controller: CaptureController,
-        mock_screenshot_capture: MagicMock,  # noqa: ARG002
-        mock_image_processor: MagicMock,  # noqa: ARG002
-        mock_change_detector: MagicMock,
-        mock_focus_tracker: MagicMock,  # noqa: ARG002
-        mock_window_enumerator: MagicMock,  # noqa: ARG002
-        mock_date_directory_manager: MagicMock,  # noqa: ARG002
-    ) -> None:
-        """Test capture with change detection skipping save."""
-        with patch.object(Image.Image, "save") as mock_save:
-            mock_save.return_value = None
-            controller._perform_capture()
-            mock_change_detector.has_changed.return_value = False
-
-            controller._perform_capture()
-
-            assert controller.capture_count == 1
+        controller._perform_capture()
 
-    def test_perform_capture_with_save_all(  # noqa: PLR0917
+        assert controller.capture_count == 1
+        mock_screenshot_capture.capture_all_monitors.assert_called_once()
+        mock_image_processor.stitch_horizontally.assert_called_once()
+        mock_focus_tracker.get_focused_application.assert_called_once()
+        mock_window_enumerator.enumerate_windows.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("save_all", "has_changed", "expected_count"),
+        [
+            (False, True, 2),
+            (False, False, 1),
+            (True, False, 2),
+        ],
+        ids=["changed", "unchanged-skipped", "unchanged-save-all"],
+    )
+    def test_perform_capture_twice(  # noqa: PLR0917
         self,
         capture_config: CaptureConfig,
-        mock_screenshot_capture: MagicMock,
-        mock_image_processor: MagicMock,
+        mock_bundle: dict[str, MagicMock],
         mock_change_detector: MagicMock,
-        mock_focus_tracker: MagicMock,
-        mock_window_enumerator: MagicMock,
-        mock_date_directory_manager: MagicMock,
-        mock_system_state_monitor: MagicMock,
-        tmp_path: Path,  # noqa: ARG002
+        save_all: bool,
+        has_changed: bool,
+        expected_count: int,
     ) -> None:
-        """Test capture with save_all_captures=True."""
+        """Test the second capture is saved only on change or with save_all."""
         config = CaptureConfig(
             output_directory=capture_config.output_directory,
             capture_interval_seconds=1,
-            save_all_captures=True,
+            save_all_captures=save_all,
         )
-        mock_change_detector.has_changed.return_value = False
+        mock_change_detector.has_changed.return_value = has_changed
 
-        controller = CaptureController(
-            config=config,
-            screenshot_capture=mock_screenshot_capture,
-            image_processor=mock_image_processor,
-            change_detector=mock_change_detector,
-            focus_tracker=mock_focus_tracker,
-            window_enumerator=mock_window_enumerator,
-            date_directory_manager=mock_date_directory_manager,
-            system_state_monitor=mock_system_state_monitor,
-        )
+        controller = CaptureController(config=config, **mock_bundle)
 
-        with patch.object(Image.Image, "save") as mock_save:
-            mock_save.return_value = None
-            controller._perform_capture()
+        controller._perform_capture()
+        controller._perform_capture()
 
-            assert controller.capture_count == 1
+        assert controller.capture_count == expected_count
 
 
 class TestCaptureControllerCallbacksInvocation:
     """Tests for callback invocation during capture."""
 
+    pytestmark = pytest.mark.slow
+
     def test_on_start_callback_invoked(
         self,
         controller: CaptureController,
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
     ) -> None:
         """Test that on_start callbacks are invoked when starting."""
         on_start = MagicMock()
@@ -458,38 +514,27 @@ class TestCaptureControllerCallbacksInvocation:
 
     def test_on_stop_callback_invoked(
         self,
-        controller: CaptureController,
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
+        controller_running: CaptureController,
     ) -> None:
         """Test that on_stop callbacks are invoked when stopping."""
         on_stop = MagicMock()
-        controller.add_on_stop_callback(on_stop)
+        controller_running.add_on_stop_callback(on_stop)
 
-        controller.start()
-        controller.stop()
+        controller_running.stop()
 
         on_stop.assert_called_once()
 
-    def test_on_capture_callback_invoked(  # noqa: PLR0917
+    def test_on_capture_callback_invoked(
         self,
         controller: CaptureController,
-        mock_screenshot_capture: MagicMock,  # noqa: ARG002
-        mock_image_processor: MagicMock,  # noqa: ARG002
-        mock_change_detector: MagicMock,  # noqa: ARG002
-        mock_focus_tracker: MagicMock,  # noqa: ARG002
-        mock_window_enumerator: MagicMock,  # noqa: ARG002
-        mock_date_directory_manager: MagicMock,  # noqa: ARG002
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
     ) -> None:
         """Test that on_capture callbacks are invoked after capture."""
         on_capture = MagicMock()
         controller.add_on_capture_callback(on_capture)
 
-        with patch.object(Image.Image, "save") as mock_save:
-            mock_save.return_value = None
-            controller._perform_capture()
+        controller._perform_capture()
 
-            on_capture.assert_called_once_with(1)
+        on_capture.assert_called_once_with(1)
 
 
 class TestCaptureControllerStatus:
@@ -499,7 +544,6 @@ class TestCaptureControllerStatus:
         self,
         controller: CaptureController,
         capture_config: CaptureConfig,
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
     ) -> None:
         """Test getting controller status."""
         status = controller.get_status()
@@ -530,7 +574,6 @@ class TestCaptureControllerForceCapture:
     def test_force_capture_paused(
         self,
         controller: CaptureController,
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
     ) -> None:
         """Test force capture when paused does nothing."""
         controller._is_running = True
@@ -543,15 +586,13 @@ class TestCaptureControllerForceCapture:
 
     def test_force_capture_running(
         self,
-        controller: CaptureController,
+        controller_running: CaptureController,
         mock_screenshot_capture: MagicMock,
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
     ) -> None:
         """Test force capture when running performs capture."""
-        controller.start()
-        controller._is_paused = False
+        controller_running._is_paused = False
 
-        controller.force_capture()
+        controller_running.force_capture()
 
         mock_screenshot_capture.capture_all_monitors.assert_called()
 
@@ -559,13 +600,15 @@ class TestCaptureControllerForceCapture:
 class TestCaptureControllerClearPrevious:
     """Tests for clearing previous composite image."""
 
-    def test_clear_previous_capture(self, controller: CaptureController) -> None:
+    def test_clear_previous_capture(
+        self, controller_minimal: CaptureController, small_rgb: Image.Image
+    ) -> None:
         """Test clearing previous composite image."""
-        controller._previous_composite = Image.new("RGB", (100, 100))
+        controller_minimal._previous_composite = small_rgb
 
-        controller.clear_previous_capture()
+        controller_minimal.clear_previous_capture()
 
-        assert controller._previous_composite is None
+        assert controller_minimal._previous_composite is None
 
 
 class TestCaptureConfig:
@@ -596,44 +639,37 @@ class TestCaptureConfig:
 class TestCaptureControllerErrorHandling:
     """Tests for error handling in CaptureController."""
 
-    def test_capture_with_screenshot_error(  # noqa: PLR0917
-        self,
-        controller: CaptureController,
-        mock_screenshot_capture: MagicMock,
-        mock_image_processor: MagicMock,  # noqa: ARG002
-        mock_change_detector: MagicMock,  # noqa: ARG002
-        mock_focus_tracker: MagicMock,  # noqa: ARG002
-        mock_window_enumerator: MagicMock,  # noqa: ARG002
-        mock_date_directory_manager: MagicMock,  # noqa: ARG002
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
-    ) -> None:
-        """Test error handling when screenshot capture fails."""
-        mock_screenshot_capture.capture_all_monitors.side_effect = OSError(
-            "Screenshot failed"
-        )
-
-        controller._perform_capture()
-
-        assert controller.last_error_msg is not None
-        assert "Screenshot failed" in controller.last_error_msg
-
-    def test_capture_with_focus_error(  # noqa: PLR0917
+    pytestmark = pytest.mark.slow
+
+    @pytest.mark.parametrize(
+        ("fixture_name", "method", "error"),
+        [
+            (
+                "mock_screenshot_capture",
+                "capture_all_monitors",
+                OSError("Screenshot failed"),
+            ),
+            (
+                "mock_focus_tracker",
+                "get_focused_application",
+                RuntimeError("Focus error"),
+            ),
+        ],
+        ids=["screenshot", "focus"],
+    )
+    def test_capture_error(
         self,
+        request: pytest.FixtureRequest,
         controller: CaptureController,
-        mock_screenshot_capture: MagicMock,  # noqa: ARG002
-        mock_image_processor: MagicMock,  # noqa: ARG002
-        mock_change_detector: MagicMock,  # noqa: ARG002
-        mock_focus_tracker: MagicMock,
-        mock_window_enumerator: MagicMock,  # noqa: ARG002
-        mock_date_directory_manager: MagicMock,  # noqa: ARG002
-        mock_system_state_monitor: MagicMock,  # noqa: ARG002
+        fixture_name: str,
+        method: str,
+        error: Exception,
     ) -> None:
-        """Test error handling when focus tracking fails."""
-        mock_focus_tracker.get_focused_application.side_effect = RuntimeError(
-            "Focus error"
-        )
+        """Test a failing dependency is reported through last_error_msg."""
+        mock = request.getfixturevalue(fixture_name)
+        getattr(mock, method).side_effect = error
 
         controller._perform_capture()
 
         assert controller.last_error_msg is not None
-        assert "Focus error" in controller.last_error_msg
+        assert str(error) in controller.last_error_msg
@@ -8,6 +8,21 @@ from activity_beacon.window_tracking.data import (
     WindowDataEntry,
     WindowInfo,
 )
+from activity_beacon.window_tracking.window_frame import WindowFrame
+
+_FROZEN_WINDOW = WindowInfo(
+    window_name="Test",
+    app_name="App",
+    pid=1,
+    is_focused=False,
+    screen_rect=(0, 0, 100, 100),
+)
+_FROZEN_FOCUSED_APP = FocusedAppData(
+    app_name="Safari",
+    pid=12345,
+    window_name="Home - Safari",
+    timestamp=datetime(2024, 1, 15, 10, 30, 0),
+)
 
 
 class TestWindowInfo:
@@ -26,18 +41,6 @@ class TestWindowInfo:
         assert window_info.is_focused is True
         assert window_info.screen_rect == (0, 0, 1920, 1080)
 
-    def test_window_info_immutable(self) -> None:
-        window_info = WindowInfo(
-            window_name="Test",
-            app_name="App",
-            pid=1,
-            is_focused=False,
-            screen_rect=(0, 0, 100, 100),
-        )
-
-        with pytest.raises(FrozenInstanceError):
-            window_info.window_name = "Changed"  # type: ignore[misc]
-
 
 class TestFocusedAppData:
     def test_focused_app_data_creation(self) -> None:
@@ -110,15 +113,62 @@ class TestWindowDataEntry:
         assert len(entry.all_windows) == 2
         assert entry.screenshot_path is None
 
-    def test_window_data_entry_immutable(
-        self, sample_focused_app_data: FocusedAppData, sample_window_info: WindowInfo
-    ) -> None:
-        entry = WindowDataEntry(
-            timestamp=datetime(2024, 1, 15, 10, 30, 0),
-            focused_app=sample_focused_app_data,
-            all_windows=(sample_window_info,),
-            screenshot_path=None,
+
+class TestWindowFrame:
+    def test_window_frame_from_windows(self) -> None:
+        windows = (
+            WindowInfo(
+                window_name="Window 1",
+                app_name="App1",
+                pid=1,
+                is_focused=True,
+                screen_rect=(0, 0, 100, 100),
+            ),
+            WindowInfo(
+                window_name="Window 2",
+                app_name="App2",
+                pid=2,
+                is_focused=False,
+                screen_rect=(100, 0, 200, 100),
+            ),
         )
 
+        frame = WindowFrame.from_windows(windows)
+
+        assert len(frame) == 2
+        assert frame.app_names == ("App1", "App2")
+        assert frame.pids == (1, 2)
+        assert frame.is_focused_mask.tolist() == [True, False]
+        assert frame.rects.shape == (2, 4)
+        assert frame.all_windows == windows
+
+    def test_window_frame_empty(self) -> None:
+        frame = WindowFrame.from_windows(())
+
+        assert len(frame) == 0
+        assert frame.rects.shape == (0, 4)
+        assert frame.all_windows == ()
+
+
+class TestImmutability:
+    @pytest.mark.parametrize(
+        ("record", "attr", "value"),
+        [
+            (_FROZEN_WINDOW, "window_name", "Changed"),
+            (_FROZEN_FOCUSED_APP, "app_name", "Changed"),
+            (
+                WindowDataEntry(
+                    timestamp=datetime(2024, 1, 15, 10, 30, 0),
+                    focused_app=_FROZEN_FOCUSED_APP,
+                    all_windows=(_FROZEN_WINDOW,),
+                    screenshot_path=None,
+                ),
+                "timestamp",
+                datetime(2024, 1, 15, 11, 0, 0),
+            ),
+        ],
+        ids=["WindowInfo", "FocusedAppData", "WindowDataEntry"],
+    )
+    def test_record_is_frozen(self, record: object, attr: str, value: object) -> None:
         with pytest.raises(FrozenInstanceError):
-            entry.timestamp = datetime(2024, 1, 15, 11, 0, 0)  # type: ignore[misc]
+            setattr(record, attr, value)
@@ -1,138 +1,119 @@
 from datetime import datetime
 from pathlib import Path
+from typing import NoReturn
 
 import pytest
 
 from activity_beacon.file_storage.date_directory_manager import DateDirectoryManager
 
 
+def _deny(*_args: object, **_kwargs: object) -> NoReturn:
+    raise PermissionError("denied")
+
+
+@pytest.fixture
+def fake_base() -> Path:
+    """Base path for tests that only compute paths and never touch the disk."""
+    return Path("/virtual/base")
+
+
+@pytest.fixture(scope="class")
+def shared_base(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One real base directory shared by the directory-creation tests."""
+    return tmp_path_factory.mktemp("dates")
+
+
 class TestDateDirectoryManager:
-    def test_init_with_path_object(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        assert manager._base_path == tmp_path
+    def test_init_with_path_object(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(fake_base)
+        assert manager._base_path == fake_base
 
-    def test_init_with_string_path(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(str(tmp_path))
-        assert manager._base_path == tmp_path
+    def test_init_with_string_path(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(str(fake_base))
+        assert manager._base_path == fake_base
 
     def test_init_with_tilde_expansion(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, fake_base: Path, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         # Mock home directory
-        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("HOME", str(fake_base))
         manager = DateDirectoryManager("~/test_dir")
-        assert manager._base_path == tmp_path / "test_dir"
+        assert manager._base_path == fake_base / "test_dir"
 
-    def test_get_date_directory_structure(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
+    def test_get_date_directory_structure(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(fake_base)
         date = datetime(2024, 3, 15, 10, 30, 0)
 
         result = manager.get_date_directory(date)
 
-        assert result == tmp_path / "2024" / "03" / "15"
+        assert result == fake_base / "2024" / "03" / "15"
 
-    def test_get_date_directory_padding(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
+    def test_get_date_directory_padding(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(fake_base)
         date = datetime(2024, 1, 5, 10, 30, 0)
 
         result = manager.get_date_directory(date)
 
-        assert result == tmp_path / "2024" / "01" / "05"
-
-    def test_ensure_date_directory_creates_hierarchy(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        date = datetime(2024, 3, 15, 10, 30, 0)
-
-        result = manager.ensure_date_directory(date)
+        assert result == fake_base / "2024" / "01" / "05"
 
-        assert result.exists()
-        assert result.is_dir()
-        assert result == tmp_path / "2024" / "03" / "15"
-
-    def test_ensure_date_directory_creates_parents(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        date = datetime(2024, 3, 15, 10, 30, 0)
-
-        manager.ensure_date_directory(date)
-
-        assert (tmp_path / "2024").exists()
-        assert (tmp_path / "2024" / "03").exists()
-        assert (tmp_path / "2024" / "03" / "15").exists()
-
-    def test_ensure_date_directory_idempotent(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        date = datetime(2024, 3, 15, 10, 30, 0)
+    @pytest.mark.parametrize(
+        "date",
+        [datetime(2024, 3, 15, 10, 30, 0), datetime(2024, 3, 16, 10, 30, 0)],
+        ids=["2024-03-15", "2024-03-16"],
+    )
+    def test_ensure_date_directory_creates_hierarchy(
+        self, shared_base: Path, date: datetime
+    ) -> None:
+        manager = DateDirectoryManager(shared_base)
+        expected = shared_base / "2024" / "03" / f"{date.day:02d}"
 
         result1 = manager.ensure_date_directory(date)
         result2 = manager.ensure_date_directory(date)
 
-        assert result1 == result2
-        assert result1.exists()
-
-    def test_ensure_date_directory_multiple_dates(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        date1 = datetime(2024, 3, 15, 10, 30, 0)
-        date2 = datetime(2024, 3, 16, 10, 30, 0)
-
-        dir1 = manager.ensure_date_directory(date1)
-        dir2 = manager.ensure_date_directory(date2)
-
-        assert dir1.exists()
-        assert dir2.exists()
-        assert dir1 != dir2
-
-    def test_ensure_date_directory_permission_error(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path / "readonly")
-        # Create parent but make it read-only
-        (tmp_path / "readonly").mkdir()
-        (tmp_path / "readonly").chmod(0o444)
+        assert result1 == result2 == expected
+        assert (shared_base / "2024").is_dir()
+        assert (shared_base / "2024" / "03").is_dir()
+        assert expected.is_dir()
 
+    def test_ensure_date_directory_permission_error(
+        self, fake_base: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager = DateDirectoryManager(fake_base)
+        monkeypatch.setattr(Path, "mkdir", _deny)
         date = datetime(2024, 3, 15, 10, 30, 0)
 
-        try:
-            with pytest.raises(OSError, match="Failed to create directory"):
-                manager.ensure_date_directory(date)
-        finally:
-            # Cleanup: restore permissions
-            (tmp_path / "readonly").chmod(0o755)
-
-    def test_get_screenshot_filename_format(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        timestamp = datetime(2024, 3, 15, 14, 30, 45)
-
-        filename = manager.get_screenshot_filename(timestamp)
-
-        assert filename == "20240315_143045.png"
-
-    def test_get_screenshot_filename_padding(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        timestamp = datetime(2024, 1, 5, 9, 5, 3)
-
-        filename = manager.get_screenshot_filename(timestamp)
-
-        assert filename == "20240105_090503.png"
-
-    def test_get_screenshot_filename_midnight(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        timestamp = datetime(2024, 12, 31, 0, 0, 0)
-
-        filename = manager.get_screenshot_filename(timestamp)
+        with pytest.raises(OSError, match="Failed to create directory"):
+            manager.ensure_date_directory(date)
+
+    @pytest.mark.parametrize(
+        ("timestamp", "expected"),
+        [
+            (datetime(2024, 3, 15, 14, 30, 45), "20240315_143045.png"),
+            (datetime(2024, 1, 5, 9, 5, 3), "20240105_090503.png"),
+            (datetime(2024, 12, 31, 0, 0, 0), "20241231_000000.png"),
+        ],
+        ids=["format", "padding", "midnight"],
+    )
+    def test_get_screenshot_filename(
+        self, fake_base: Path, timestamp: datetime, expected: str
+    ) -> None:
+        manager = DateDirectoryManager(fake_base)
 
-        assert filename == "20241231_000000.png"
+        assert manager.get_screenshot_filename(timestamp) == expected
 
     def test_get_screenshot_path_combines_directory_and_filename(
-        self, tmp_path: Path
+        self, fake_base: Path
     ) -> None:
-        manager = DateDirectoryManager(tmp_path)
+        manager = DateDirectoryManager(fake_base)
         timestamp = datetime(2024, 3, 15, 14, 30, 45)
 
         path = manager.get_screenshot_path(timestamp)
 
-        expected = tmp_path / "2024" / "03" / "15" / "20240315_143045.png"
+        expected = fake_base / "2024" / "03" / "15" / "20240315_143045.png"
         assert path == expected
 
-    def test_get_screenshot_path_different_dates(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
+    def test_get_screenshot_path_different_dates(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(fake_base)
         timestamp1 = datetime(2024, 3, 15, 14, 30, 45)
         timestamp2 = datetime(2024, 3, 16, 10, 15, 30)
 
@@ -143,26 +124,26 @@ class TestDateDirectoryManager:
         assert path1.name == "20240315_143045.png"
         assert path2.name == "20240316_101530.png"
 
-    def test_validate_path_security_valid_path(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
-        valid_path = tmp_path / "2024" / "03" / "15" / "screenshot.png"
+    def test_validate_path_security_valid_path(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(fake_base)
+        valid_path = fake_base / "2024" / "03" / "15" / "screenshot.png"
 
         assert manager.validate_path_security(valid_path) is True
 
-    def test_validate_path_security_base_path(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path)
+    def test_validate_path_security_base_path(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(fake_base)
 
-        assert manager.validate_path_security(tmp_path) is True
+        assert manager.validate_path_security(fake_base) is True
 
-    def test_validate_path_security_traversal_attempt(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path / "screenshots")
+    def test_validate_path_security_traversal_attempt(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(fake_base / "screenshots")
         # Try to escape to parent directory
-        malicious_path = tmp_path / "screenshots" / ".." / "etc" / "passwd"
+        malicious_path = fake_base / "screenshots" / ".." / "etc" / "passwd"
 
         assert manager.validate_path_security(malicious_path) is False
 
-    def test_validate_path_security_absolute_outside(self, tmp_path: Path) -> None:
-        manager = DateDirectoryManager(tmp_path / "screenshots")
+    def test_validate_path_security_absolute_outside(self, fake_base: Path) -> None:
+        manager = DateDirectoryManager(fake_base / "screenshots")
         outside_path = Path("/etc/passwd")
 
         assert manager.validate_path_security(outside_path) is False
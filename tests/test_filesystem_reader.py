@@ -1,5 +1,8 @@
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from pathlib import Path
+import shutil
+from typing import NoReturn
 
 import pytest
 
@@ -8,24 +11,75 @@ from activity_beacon.file_storage.filesystem_reader import (
     ValidationReport,
 )
 
+TouchFiles = Callable[[Path, Iterable[str]], None]
+MakeDateDir = Callable[[Path, datetime], Path]
 
-class TestFileSystemReader:
-    """Test suite for FileSystemReader."""
 
-    def test_init_with_path_object(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
-        assert reader._base_path == tmp_path
+def _deny(*_args: object, **_kwargs: object) -> NoReturn:
+    raise PermissionError("Permission denied")
+
+
+@pytest.fixture(scope="session")
+def _template_date_dir(
+    tmp_path_factory: pytest.TempPathFactory,
+    touch_files: TouchFiles,
+    make_date_dir: MakeDateDir,
+) -> Path:
+    """Build the 2024/03/15 tree with two screenshots and window data once."""
+    base = tmp_path_factory.mktemp("date_dir_template")
+    date_dir = make_date_dir(base, datetime(2024, 3, 15))
+    touch_files(
+        date_dir, ["20240315_103000.png", "20240315_104000.png", "window_data.jsonl"]
+    )
+    return base
+
+
+@pytest.fixture
+def populated_date_dir(_template_date_dir: Path, tmp_path: Path) -> Path:
+    """Copy the template tree into this test's tmp_path and return the base."""
+    shutil.copytree(_template_date_dir, tmp_path, dirs_exist_ok=True)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def complete_report(_template_date_dir: Path) -> ValidationReport:
+    """Validate the untouched template once; the report is frozen."""
+    reader = FileSystemReader(_template_date_dir)
+    return reader.validate_date_directory(datetime(2024, 3, 15, 10, 30, 0))
 
-    def test_init_with_string_path(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(str(tmp_path))
-        assert reader._base_path == tmp_path
 
-    def test_init_with_tilde_expansion(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+@pytest.fixture(scope="module")
+def pure_reader(tmp_path_factory: pytest.TempPathFactory) -> FileSystemReader:
+    """Shared reader for tests that only compute names and paths."""
+    return FileSystemReader(tmp_path_factory.mktemp("pure"))
+
+
+class TestFileSystemReader:
+    """Test suite for FileSystemReader."""
+
+    @pytest.mark.parametrize(
+        ("base_path_arg", "expected"),
+        [
+            (Path("captures"), "captures"),
+            ("captures", "captures"),
+            ("~/test_dir", "test_dir"),
+        ],
+        ids=["path-object", "string-path", "tilde-expansion"],
+    )
+    def test_init_base_path(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        base_path_arg: Path | str,
+        expected: str,
     ) -> None:
+        # Relative paths resolve against the cwd and "~" against HOME
+        monkeypatch.chdir(tmp_path)
         monkeypatch.setenv("HOME", str(tmp_path))
-        reader = FileSystemReader("~/test_dir")
-        assert reader._base_path == tmp_path / "test_dir"
+
+        reader = FileSystemReader(base_path_arg)
+
+        assert reader._base_path == tmp_path / expected
 
     def test_validate_date_directory_not_exists(self, tmp_path: Path) -> None:
         reader = FileSystemReader(tmp_path)
@@ -55,13 +109,14 @@ class TestFileSystemReader:
         assert len(report.errors) == 1
         assert "not a directory" in report.errors[0]
 
-    def test_validate_date_directory_empty(self, tmp_path: Path) -> None:
+    def test_validate_date_directory_empty(
+        self, tmp_path: Path, make_date_dir: MakeDateDir
+    ) -> None:
         reader = FileSystemReader(tmp_path)
         date = datetime(2024, 3, 15, 10, 30, 0)
 
         # Create empty directory
-        date_dir = tmp_path / "2024" / "03" / "15"
-        date_dir.mkdir(parents=True)
+        make_date_dir(tmp_path, date)
 
         report = reader.validate_date_directory(date)
 
@@ -72,17 +127,14 @@ class TestFileSystemReader:
         assert "No valid screenshot files found" in report.warnings[1]
 
     def test_validate_date_directory_with_valid_screenshots(
-        self, tmp_path: Path
+        self, populated_date_dir: Path
     ) -> None:
-        reader = FileSystemReader(tmp_path)
+        reader = FileSystemReader(populated_date_dir)
         date = datetime(2024, 3, 15, 10, 30, 0)
 
-        # Create directory with valid screenshots
-        date_dir = tmp_path / "2024" / "03" / "15"
-        date_dir.mkdir(parents=True)
-        (date_dir / "20240315_103000.png").touch()
+        # Add a third valid screenshot to the template's two
+        date_dir = populated_date_dir / "2024" / "03" / "15"
         (date_dir / "20240315_103030.png").touch()
-        (date_dir / "20240315_104000.png").touch()
 
         report = reader.validate_date_directory(date)
 
@@ -93,53 +145,32 @@ class TestFileSystemReader:
         assert "20240315_103030.png" in report.found_screenshots
         assert "20240315_104000.png" in report.found_screenshots
 
-    def test_validate_date_directory_with_window_data(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
-        date = datetime(2024, 3, 15, 10, 30, 0)
-
-        # Create directory with window data file
-        date_dir = tmp_path / "2024" / "03" / "15"
-        date_dir.mkdir(parents=True)
-        (date_dir / "window_data.jsonl").touch()
-
-        report = reader.validate_date_directory(date)
-
-        assert report.is_valid is True
-        assert len(report.errors) == 0
-        assert len(report.found_data_files) == 1
-        assert "window_data.jsonl" in report.found_data_files
-
-    def test_validate_date_directory_complete(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
-        date = datetime(2024, 3, 15, 10, 30, 0)
-
-        # Create complete directory structure
-        date_dir = tmp_path / "2024" / "03" / "15"
-        date_dir.mkdir(parents=True)
-        (date_dir / "20240315_103000.png").touch()
-        (date_dir / "20240315_104000.png").touch()
-        (date_dir / "window_data.jsonl").touch()
-
-        report = reader.validate_date_directory(date)
+    def test_validate_date_directory_with_window_data(
+        self, complete_report: ValidationReport
+    ) -> None:
+        assert complete_report.is_valid is True
+        assert len(complete_report.errors) == 0
+        assert len(complete_report.found_data_files) == 1
+        assert "window_data.jsonl" in complete_report.found_data_files
 
-        assert report.is_valid is True
-        assert len(report.errors) == 0
-        assert len(report.warnings) == 0
-        assert len(report.found_screenshots) == 2
-        assert len(report.found_data_files) == 1
+    def test_validate_date_directory_complete(
+        self, complete_report: ValidationReport
+    ) -> None:
+        assert complete_report.is_valid is True
+        assert len(complete_report.errors) == 0
+        assert len(complete_report.warnings) == 0
+        assert len(complete_report.found_screenshots) == 2
+        assert len(complete_report.found_data_files) == 1
 
     def test_validate_date_directory_invalid_screenshot_names(
-        self, tmp_path: Path
+        self, tmp_path: Path, touch_files: TouchFiles, make_date_dir: MakeDateDir
     ) -> None:
         reader = FileSystemReader(tmp_path)
         date = datetime(2024, 3, 15, 10, 30, 0)
 
         # Create directory with invalid screenshot names
-        date_dir = tmp_path / "2024" / "03" / "15"
-        date_dir.mkdir(parents=True)
-        (date_dir / "invalid_name.png").touch()
-        (date_dir / "20240315.png").touch()
-        (date_dir / "screenshot.png").touch()
+        date_dir = make_date_dir(tmp_path, date)
+        touch_files(date_dir, ["invalid_name.png", "20240315.png", "screenshot.png"])
 
         report = reader.validate_date_directory(date)
 
@@ -148,35 +179,34 @@ class TestFileSystemReader:
         assert len(report.warnings) >= 3  # One for each invalid PNG
         assert len(report.found_screenshots) == 0
 
-    def test_validate_date_directory_permission_error(self, tmp_path: Path) -> None:
+    def test_validate_date_directory_permission_error(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        make_date_dir: MakeDateDir,
+    ) -> None:
         reader = FileSystemReader(tmp_path)
         date = datetime(2024, 3, 15, 10, 30, 0)
 
-        # Create directory and make it unreadable
-        date_dir = tmp_path / "2024" / "03" / "15"
-        date_dir.mkdir(parents=True)
-        date_dir.chmod(0o000)
+        # Make the directory unreadable without a chmod, which root ignores
+        make_date_dir(tmp_path, date)
+        monkeypatch.setattr(Path, "iterdir", _deny)
 
-        try:
-            report = reader.validate_date_directory(date)
+        report = reader.validate_date_directory(date)
 
-            assert report.is_valid is False
-            assert len(report.errors) >= 1
-            assert "Permission denied" in report.errors[0]
-            assert reader.last_error_msg is not None
-        finally:
-            # Cleanup: restore permissions
-            date_dir.chmod(0o755)
+        assert report.is_valid is False
+        assert len(report.errors) >= 1
+        assert "Permission denied" in report.errors[0]
+        assert reader.last_error_msg is not None
 
     def test_validate_date_directory_window_data_is_directory(
-        self, tmp_path: Path
+        self, tmp_path: Path, make_date_dir: MakeDateDir
     ) -> None:
         reader = FileSystemReader(tmp_path)
         date = datetime(2024, 3, 15, 10, 30, 0)
 
         # Create window_data.jsonl as directory instead of file
-        date_dir = tmp_path / "2024" / "03" / "15"
-        date_dir.mkdir(parents=True)
+        date_dir = make_date_dir(tmp_path, date)
         (date_dir / "window_data.jsonl").mkdir()
 
         report = reader.validate_date_directory(date)
@@ -185,59 +215,58 @@ class TestFileSystemReader:
         assert len(report.errors) == 1
         assert "not a file" in report.errors[0]
 
-    def test_is_valid_screenshot_name_valid_cases(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
-
-        assert reader._is_valid_screenshot_name("20240315_103000.png") is True
-        assert reader._is_valid_screenshot_name("20241231_235959.png") is True
-        assert reader._is_valid_screenshot_name("20240101_000000.png") is True
-
-    def test_is_valid_screenshot_name_invalid_cases(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
-
-        assert reader._is_valid_screenshot_name("invalid.png") is False
-        assert reader._is_valid_screenshot_name("20240315.png") is False
-        assert reader._is_valid_screenshot_name("2024-03-15_103000.png") is False
-        assert reader._is_valid_screenshot_name("20240315_10300.png") is False
-        assert reader._is_valid_screenshot_name("20240315_103000.jpg") is False
-        assert reader._is_valid_screenshot_name("screenshot.png") is False
-
-    def test_validate_screenshot_filename_valid(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
-        date = datetime(2024, 3, 15, 10, 30, 0)
-
-        assert reader.validate_screenshot_filename("20240315_103000.png", date) is True
-        assert reader.validate_screenshot_filename("20240315_235959.png", date) is True
-
-    def test_validate_screenshot_filename_wrong_date(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
-        date = datetime(2024, 3, 15, 10, 30, 0)
-
-        assert reader.validate_screenshot_filename("20240316_103000.png", date) is False
-        assert reader.validate_screenshot_filename("20240314_103000.png", date) is False
-
-    def test_validate_screenshot_filename_invalid_format(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("20240315_103000.png", True),
+            ("20241231_235959.png", True),
+            ("20240101_000000.png", True),
+            ("invalid.png", False),
+            ("20240315.png", False),
+            ("2024-03-15_103000.png", False),
+            ("20240315_10300.png", False),
+            ("20240315_103000.jpg", False),
+            ("screenshot.png", False),
+        ],
+    )
+    def test_is_valid_screenshot_name(
+        self, pure_reader: FileSystemReader, filename: str, expected: bool
+    ) -> None:
+        assert pure_reader._is_valid_screenshot_name(filename) is expected
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("20240315_103000.png", True),
+            ("20240315_235959.png", True),
+            ("20240316_103000.png", False),
+            ("20240314_103000.png", False),
+            ("invalid.png", False),
+            ("20240315.png", False),
+        ],
+    )
+    def test_validate_screenshot_filename(
+        self, pure_reader: FileSystemReader, filename: str, expected: bool
+    ) -> None:
         date = datetime(2024, 3, 15, 10, 30, 0)
 
-        assert reader.validate_screenshot_filename("invalid.png", date) is False
-        assert reader.validate_screenshot_filename("20240315.png", date) is False
+        assert pure_reader.validate_screenshot_filename(filename, date) is expected
 
-    def test_get_date_directory_path(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
+    def test_get_date_directory_path(self, pure_reader: FileSystemReader) -> None:
         date = datetime(2024, 3, 15, 10, 30, 0)
 
-        path = reader.get_date_directory_path(date)
+        path = pure_reader.get_date_directory_path(date)
 
-        assert path == tmp_path / "2024" / "03" / "15"
+        assert path == pure_reader._base_path / "2024" / "03" / "15"
 
-    def test_get_date_directory_path_padding(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
+    def test_get_date_directory_path_padding(
+        self, pure_reader: FileSystemReader
+    ) -> None:
         date = datetime(2024, 1, 5, 10, 30, 0)
 
-        path = reader.get_date_directory_path(date)
+        path = pure_reader.get_date_directory_path(date)
 
-        assert path == tmp_path / "2024" / "01" / "05"
+        assert path == pure_reader._base_path / "2024" / "01" / "05"
 
     def test_validation_report_immutability(self) -> None:
         report = ValidationReport(
@@ -252,18 +281,15 @@ class TestFileSystemReader:
         with pytest.raises((AttributeError, Exception)):
             report.is_valid = False  # type: ignore[misc]
 
-    def test_validate_date_directory_mixed_files(self, tmp_path: Path) -> None:
-        reader = FileSystemReader(tmp_path)
+    def test_validate_date_directory_mixed_files(
+        self, populated_date_dir: Path, touch_files: TouchFiles
+    ) -> None:
+        reader = FileSystemReader(populated_date_dir)
         date = datetime(2024, 3, 15, 10, 30, 0)
 
-        # Create directory with mix of valid and invalid files
-        date_dir = tmp_path / "2024" / "03" / "15"
-        date_dir.mkdir(parents=True)
-        (date_dir / "20240315_103000.png").touch()  # Valid
-        (date_dir / "20240315_104000.png").touch()  # Valid
-        (date_dir / "invalid.png").touch()  # Invalid
-        (date_dir / "readme.txt").touch()  # Not PNG
-        (date_dir / "window_data.jsonl").touch()  # Data file
+        # Add invalid files next to the template's valid screenshots and data
+        date_dir = populated_date_dir / "2024" / "03" / "15"
+        touch_files(date_dir, ["invalid.png", "readme.txt"])
 
         report = reader.validate_date_directory(date)
 
@@ -1,20 +1,24 @@
 """Tests for FocusTracker class."""
 
 from datetime import UTC, datetime
+import sys
 
 import pytest
 
 from activity_beacon.window_tracking.data import FocusedAppData
 from activity_beacon.window_tracking.focus_tracker import FocusTracker
 
+# Every test here queries the live NSWorkspace
+pytestmark = pytest.mark.skipif(sys.platform != "darwin", reason="macOS-only")
+
 
 class TestFocusTracker:
     """Test suite for FocusTracker class."""
 
     @pytest.fixture
-    def tracker(self) -> FocusTracker:
-        """Create a FocusTracker instance for testing."""
-        return FocusTracker()
+    def tracker(self, focus_tracker: FocusTracker) -> FocusTracker:
+        """Return the session-wide FocusTracker instance."""
+        return focus_tracker
 
     def test_init(self, tracker: FocusTracker) -> None:
         """Test that FocusTracker initializes correctly."""
@@ -59,6 +63,7 @@ class TestFocusTracker:
         assert result.timestamp.tzinfo is not None
         assert result.timestamp.tzinfo == UTC
 
+    @pytest.mark.slow
     def test_get_focused_application_timestamp_is_recent(
         self, tracker: FocusTracker
     ) -> None:
@@ -70,6 +75,7 @@ class TestFocusTracker:
         # Timestamp should be between before and after
         assert before <= result.timestamp <= after
 
+    @pytest.mark.slow
     def test_get_focused_application_consistency(self, tracker: FocusTracker) -> None:
         """Test that consecutive calls return consistent data."""
         result1 = tracker.get_focused_application()
@@ -1,13 +1,18 @@
+from collections.abc import Callable
+
 from PIL import Image
 import pytest
 
 from activity_beacon.screenshot.image_processor import ImageProcessor
 
+# Inputs are real monitor resolutions shrunk by SCALE; 40 divides all of them
+# exactly, so the scaling math still lands on whole pixels.
+SCALE = 40
+
+# For tests where the input's size and content don't matter
+_TINY = Image.new("RGB", (1, 1), (255, 0, 0))
 
-def create_test_image(
-    width: int, height: int, color: tuple[int, int, int]
-) -> Image.Image:
-    return Image.new("RGB", (width, height), color)
+SolidImageFactory = Callable[[int, int, tuple[int, int, int]], Image.Image]
 
 
 class TestImageProcessor:
@@ -16,95 +21,92 @@ class TestImageProcessor:
         with pytest.raises(ValueError, match="Cannot stitch empty image collection"):
             processor.stitch_horizontally({})
 
-    def test_stitch_single_image(self) -> None:
-        processor = ImageProcessor()
-        image = create_test_image(1920, 1080, (255, 0, 0))
-
-        result = processor.stitch_horizontally({1: image})
-
-        assert result.width == 1920
-        assert result.height == 1080
-
-    def test_stitch_two_same_resolution(self) -> None:
-        processor = ImageProcessor()
-
-        image1 = create_test_image(1920, 1080, (255, 0, 0))
-        image2 = create_test_image(1920, 1080, (0, 255, 0))
-
-        result = processor.stitch_horizontally({1: image1, 2: image2})
-
-        assert result.width == 3840
-        assert result.height == 1080
-
-    def test_stitch_two_different_resolution_smaller_scaled(self) -> None:
-        processor = ImageProcessor()
+    def test_stitch_single_image(self, image_processor: ImageProcessor) -> None:
+        result = image_processor.stitch_horizontally({1: _TINY})
 
-        image1 = create_test_image(1920, 1080, (255, 0, 0))
-        image2 = create_test_image(2560, 1440, (0, 255, 0))
+        assert result.width == 1
+        assert result.height == 1
 
-        result = processor.stitch_horizontally({1: image1, 2: image2})
+    def test_stitch_two_same_resolution(
+        self, image_processor: ImageProcessor, solid_image_factory: SolidImageFactory
+    ) -> None:
+        image1 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (255, 0, 0))
+        image2 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (0, 255, 0))
 
-        assert result.width == 5120
-        assert result.height == 1440
+        result = image_processor.stitch_horizontally({1: image1, 2: image2})
 
-    def test_stitch_three_monitors_different_resolutions(self) -> None:
-        processor = ImageProcessor()
+        assert result.width == 3840 // SCALE
+        assert result.height == 1080 // SCALE
 
-        image1 = create_test_image(1920, 1080, (255, 0, 0))
-        image2 = create_test_image(2560, 1440, (0, 255, 0))
-        image3 = create_test_image(1280, 720, (0, 0, 255))
+    def test_stitch_two_different_resolution_smaller_scaled(
+        self, image_processor: ImageProcessor, solid_image_factory: SolidImageFactory
+    ) -> None:
+        image1 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (255, 0, 0))
+        image2 = solid_image_factory(2560 // SCALE, 1440 // SCALE, (0, 255, 0))
 
-        result = processor.stitch_horizontally({1: image1, 2: image2, 3: image3})
+        result = image_processor.stitch_horizontally({1: image1, 2: image2})
 
-        assert result.width == 7680
-        assert result.height == 1440
+        assert result.width == 5120 // SCALE
+        assert result.height == 1440 // SCALE
 
-    def test_stitch_preserves_aspect_ratio(self) -> None:
-        processor = ImageProcessor()
+    def test_stitch_three_monitors_different_resolutions(
+        self, image_processor: ImageProcessor, solid_image_factory: SolidImageFactory
+    ) -> None:
+        image1 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (255, 0, 0))
+        image2 = solid_image_factory(2560 // SCALE, 1440 // SCALE, (0, 255, 0))
+        image3 = solid_image_factory(1280 // SCALE, 720 // SCALE, (0, 0, 255))
 
-        image1 = create_test_image(1920, 1080, (255, 0, 0))
-        image2 = create_test_image(3840, 2160, (0, 255, 0))
+        result = image_processor.stitch_horizontally({1: image1, 2: image2, 3: image3})
 
-        result = processor.stitch_horizontally({1: image1, 2: image2})
+        assert result.width == 7680 // SCALE
+        assert result.height == 1440 // SCALE
 
-        assert result.width == 7680
-        assert result.height == 2160
+    def test_stitch_preserves_aspect_ratio(
+        self, image_processor: ImageProcessor, solid_image_factory: SolidImageFactory
+    ) -> None:
+        image1 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (255, 0, 0))
+        image2 = solid_image_factory(3840 // SCALE, 2160 // SCALE, (0, 255, 0))
 
-    def test_stitch_uses_lanczos_resampling(self) -> None:
-        processor = ImageProcessor()
+        result = image_processor.stitch_horizontally({1: image1, 2: image2})
 
-        image1 = create_test_image(1920, 1080, (255, 0, 0))
-        image2 = create_test_image(1920, 1080, (0, 255, 0))
+        assert result.width == 7680 // SCALE
+        assert result.height == 2160 // SCALE
 
-        result = processor.stitch_horizontally({1: image1, 2: image2})
+    def test_stitch_uses_lanczos_resampling(
+        self, image_processor: ImageProcessor, solid_image_factory: SolidImageFactory
+    ) -> None:
+        image1 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (255, 0, 0))
+        image2 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (0, 255, 0))
 
-        assert result.width == 3840
-        assert result.height == 1080
+        result = image_processor.stitch_horizontally({1: image1, 2: image2})
 
-    def test_stitch_monitor_order(self) -> None:
-        processor = ImageProcessor()
+        assert result.width == 3840 // SCALE
+        assert result.height == 1080 // SCALE
 
-        image1 = create_test_image(1920, 1080, (255, 0, 0))
-        image2 = create_test_image(1920, 1080, (0, 255, 0))
-        image3 = create_test_image(1920, 1080, (0, 0, 255))
+    def test_stitch_monitor_order(
+        self, image_processor: ImageProcessor, solid_image_factory: SolidImageFactory
+    ) -> None:
+        image1 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (255, 0, 0))
+        image2 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (0, 255, 0))
+        image3 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (0, 0, 255))
 
-        result = processor.stitch_horizontally({3: image3, 1: image1, 2: image2})
+        result = image_processor.stitch_horizontally({3: image3, 1: image1, 2: image2})
 
-        assert result.width == 5760
-        assert result.height == 1080
+        assert result.width == 5760 // SCALE
+        assert result.height == 1080 // SCALE
 
-    def test_stitch_with_metadata(self) -> None:
-        processor = ImageProcessor()
-
-        image1 = create_test_image(1920, 1080, (255, 0, 0))
-        image2 = create_test_image(1920, 1080, (0, 255, 0))
+    def test_stitch_with_metadata(
+        self, image_processor: ImageProcessor, solid_image_factory: SolidImageFactory
+    ) -> None:
+        image1 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (255, 0, 0))
+        image2 = solid_image_factory(1920 // SCALE, 1080 // SCALE, (0, 255, 0))
 
         metadata: dict[int, dict[str, object]] = {
             1: {"is_primary": True},
             2: {"is_primary": False},
         }
 
-        _, stitch_metadata = processor.stitch_with_metadata(
+        _, stitch_metadata = image_processor.stitch_with_metadata(
             {1: image1, 2: image2}, metadata
         )
 
@@ -116,30 +118,33 @@ class TestImageProcessor:
         assert stitch_metadata["monitor_count"] == 2
         assert stitch_metadata["monitor_metadata"] == metadata
 
-    def test_calculate_scale_factor_equal(self) -> None:
-        processor = ImageProcessor()
-        scale = processor._calculate_scale_factor(1920, 1080, 1920, 1080)
+    def test_calculate_scale_factor_equal(
+        self, image_processor: ImageProcessor
+    ) -> None:
+        scale = image_processor._calculate_scale_factor(1920, 1080, 1920, 1080)
         assert scale == 1.0
 
-    def test_calculate_scale_factor_width_constrained(self) -> None:
-        processor = ImageProcessor()
-        scale = processor._calculate_scale_factor(1920, 1080, 960, 1080)
+    def test_calculate_scale_factor_width_constrained(
+        self, image_processor: ImageProcessor
+    ) -> None:
+        scale = image_processor._calculate_scale_factor(1920, 1080, 960, 1080)
         assert scale == 0.5
 
-    def test_calculate_scale_factor_height_constrained(self) -> None:
-        processor = ImageProcessor()
-        scale = processor._calculate_scale_factor(1920, 1080, 1920, 540)
+    def test_calculate_scale_factor_height_constrained(
+        self, image_processor: ImageProcessor
+    ) -> None:
+        scale = image_processor._calculate_scale_factor(1920, 1080, 1920, 540)
         assert scale == 0.5
 
-    def test_calculate_scale_factor_maintains_aspect(self) -> None:
-        processor = ImageProcessor()
-        scale = processor._calculate_scale_factor(1920, 1080, 3840, 2160)
+    def test_calculate_scale_factor_maintains_aspect(
+        self, image_processor: ImageProcessor
+    ) -> None:
+        scale = image_processor._calculate_scale_factor(1920, 1080, 3840, 2160)
         assert scale == 2.0
 
     def test_last_error_msg_is_none_on_success(self) -> None:
         processor = ImageProcessor()
-        image = Image.new("RGB", (1920, 1080), (255, 0, 0))
 
-        processor.stitch_horizontally({1: image})
+        processor.stitch_horizontally({1: _TINY})
 
         assert processor.last_error_msg is None
@@ -1,34 +1,38 @@
 """Integration tests for the complete capture cycle."""
 
-from collections.abc import Generator
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import replace
 from datetime import UTC, datetime
-from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import MagicMock
 
 from PIL import Image
 import pytest
 
 from activity_beacon.daemon.capture_controller import CaptureConfig, CaptureController
-from activity_beacon.file_storage.date_directory_manager import DateDirectoryManager
-from activity_beacon.screenshot.capture import MonitorInfo, ScreenshotCapture
-from activity_beacon.screenshot.change_detector import ChangeDetector
-from activity_beacon.screenshot.image_processor import ImageProcessor
-from activity_beacon.system_state.system_state_monitor import SystemStateMonitor
+from activity_beacon.screenshot.capture import MonitorInfo
 from activity_beacon.window_tracking.data import FocusedAppData, WindowInfo
-from activity_beacon.window_tracking.focus_tracker import FocusTracker
-from activity_beacon.window_tracking.window_enumerator import WindowEnumerator
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+FreshMock = Callable[[MagicMock], MagicMock]
+
+# Computed once per module; these tests never depend on crossing midnight.
+_NOW = datetime.now(UTC)
+_DATE_SUBPATH = f"{_NOW.year:04d}/{_NOW.month:02d}/{_NOW.day:02d}"
+_STAMP = _NOW.strftime("%Y%m%d_%H%M%S")
 
 
 @pytest.fixture
-def temp_output_dir(tmp_path: Path) -> Generator[Path, None, None]:
+def temp_output_dir(tmp_path: Path) -> Path:
     """Create a temporary output directory for captures."""
     output_dir = tmp_path / "captures"
     output_dir.mkdir()
-    yield output_dir
-    if output_dir.exists():
-        for file in output_dir.rglob("*"):
-            if file.is_file():
-                file.unlink()
+    return output_dir
 
 
 @pytest.fixture
@@ -42,104 +46,141 @@ def capture_config(temp_output_dir: Path) -> CaptureConfig:
     )
 
 
-@pytest.fixture
-def sample_monitor_info() -> list[MonitorInfo]:
-    """Create sample monitor information."""
-    return [
-        MonitorInfo(
-            monitor_id=1,
-            name="Monitor 1",
-            x=0,
-            y=0,
-            width=1920,
-            height=1080,
-            is_primary=True,
-        ),
-    ]
-
-
-@pytest.fixture
+# Frozen sample data, built once at import and shared for the whole session.
+_SAMPLE_MONITOR_INFO = (
+    MonitorInfo(
+        monitor_id=1,
+        name="Monitor 1",
+        x=0,
+        y=0,
+        width=1920,
+        height=1080,
+        is_primary=True,
+    ),
+)
+
+_SAMPLE_FOCUSED_APP = FocusedAppData(
+    app_name="Safari",
+    pid=12345,
+    window_name="Test Page - Example Website",
+    timestamp=_NOW,
+)
+
+_SAMPLE_WINDOWS = (
+    WindowInfo(
+        window_name="Test Window",
+        app_name="Test App",
+        pid=12345,
+        is_focused=True,
+        screen_rect=(0, 0, 1920, 1080),
+    ),
+    WindowInfo(
+        window_name="Another Window",
+        app_name="Other App",
+        pid=67890,
+        is_focused=False,
+        screen_rect=(100, 100, 800, 600),
+    ),
+)
+
+
+@pytest.fixture(scope="session")
+def sample_monitor_info() -> tuple[MonitorInfo, ...]:
+    """Return sample monitor information."""
+    return _SAMPLE_MONITOR_INFO
+
+
+@pytest.fixture(scope="session")
 def sample_screenshot() -> Image.Image:
-    """Create a sample screenshot image."""
-    return Image.new("RGB", (1920, 1080), color="blue")
+    """Create a sample screenshot image (1x1; nothing reads its pixels)."""
+    return Image.new("RGB", (1, 1), color="blue")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_composite() -> Image.Image:
-    """Create a sample composite image."""
-    return Image.new("RGB", (1920, 1080), color="green")
+    """Create a sample composite image (1x1; nothing reads its pixels)."""
+    return Image.new("RGB", (1, 1), color="green")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_focused_app() -> FocusedAppData:
-    """Create sample focused application data."""
-    return FocusedAppData(
-        app_name="Safari",
-        pid=12345,
-        window_name="Test Page - Example Website",
-        timestamp=datetime.now(UTC),
-    )
+    """Return sample focused application data."""
+    return _SAMPLE_FOCUSED_APP
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_windows() -> tuple[WindowInfo, ...]:
-    """Create sample window information."""
-    return (
-        WindowInfo(
-            window_name="Test Window",
-            app_name="Test App",
-            pid=12345,
-            is_focused=True,
-            screen_rect=(0, 0, 1920, 1080),
-        ),
-        WindowInfo(
-            window_name="Another Window",
-            app_name="Other App",
-            pid=67890,
-            is_focused=False,
-            screen_rect=(100, 100, 800, 600),
-        ),
-    )
+    """Return sample window information."""
+    return _SAMPLE_WINDOWS
+
+
+class _Counter:
+    """Callback stand-in that only records how often and with what it was called."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.last_args: tuple[object, ...] = ()
+
+    def __call__(self, *args: object) -> None:
+        self.count += 1
+        self.last_args = args
 
 
 @pytest.fixture(scope="function")
 def mock_screenshot_capture(
     sample_screenshot: Image.Image,
+    screenshot_capture_template: MagicMock,
+    fresh_mock: FreshMock,
 ) -> MagicMock:
     """Create a mock ScreenshotCapture with realistic behavior."""
-    mock = MagicMock(spec=ScreenshotCapture)
+    mock = fresh_mock(screenshot_capture_template)
     mock.capture_all_monitors.return_value = {1: sample_screenshot}
     return mock
 
 
 @pytest.fixture(scope="function")
-def mock_image_processor(sample_composite: Image.Image) -> MagicMock:
+def mock_image_processor(
+    sample_composite: Image.Image,
+    image_processor_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock ImageProcessor with realistic behavior."""
-    mock = MagicMock(spec=ImageProcessor)
+    mock = fresh_mock(image_processor_template)
     mock.stitch_horizontally.return_value = sample_composite
     return mock
 
 
 @pytest.fixture(scope="function")
-def mock_change_detector() -> MagicMock:
+def mock_change_detector(
+    change_detector_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock ChangeDetector."""
-    mock = MagicMock(spec=ChangeDetector)
+    mock = fresh_mock(change_detector_template)
     mock.has_changed.return_value = True
     return mock
 
 
 @pytest.fixture(scope="function")
-def mock_focus_tracker(sample_focused_app: FocusedAppData) -> MagicMock:
+def mock_focus_tracker(
+    sample_focused_app: FocusedAppData,
+    focus_tracker_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock FocusTracker."""
-    mock = MagicMock(spec=FocusTracker)
+    mock = fresh_mock(focus_tracker_template)
     mock.get_focused_application.return_value = sample_focused_app
     return mock
 
 
 @pytest.fixture(scope="function")
-def mock_window_enumerator(sample_windows: tuple[WindowInfo, ...]) -> MagicMock:
+def mock_window_enumerator(
+    sample_windows: tuple[WindowInfo, ...],
+    window_enumerator_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock WindowEnumerator."""
-    mock = MagicMock(spec=WindowEnumerator)
+    mock = fresh_mock(window_enumerator_template)
     mock.enumerate_windows.return_value = sample_windows
     return mock
 
@@ -147,28 +188,25 @@ def mock_window_enumerator(sample_windows: tuple[WindowInfo, ...]) -> MagicMock:
 @pytest.fixture(scope="function")
 def mock_date_directory_manager(
     temp_output_dir: Path,
-) -> Generator[MagicMock, None, None]:
+    date_directory_manager_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock DateDirectoryManager."""
-    mock = MagicMock(spec=DateDirectoryManager)
-    today = datetime.now(UTC)
-    date_dir = (
-        temp_output_dir
-        / f"{today.year:04d}"
-        / f"{today.month:02d}"
-        / f"{today.day:02d}"
-    )
-    date_dir.mkdir(parents=True, exist_ok=True)
+    mock = fresh_mock(date_directory_manager_template)
+    date_dir = temp_output_dir / _DATE_SUBPATH
+    # No mkdir: the controller creates the directory itself before saving
     mock.ensure_date_directory.return_value = date_dir
-    mock.get_screenshot_path.return_value = (
-        date_dir / f"{today.strftime("%Y%m%d_%H%M%S")}.png"
-    )
+    mock.get_screenshot_path.return_value = date_dir / f"{_STAMP}.png"
     return mock
 
 
 @pytest.fixture(scope="function")
-def mock_system_state_monitor() -> MagicMock:
+def mock_system_state_monitor(
+    system_state_monitor_template: MagicMock,
+    fresh_mock: FreshMock,
+) -> MagicMock:
     """Create a mock SystemStateMonitor."""
-    mock = MagicMock(spec=SystemStateMonitor)
+    mock = fresh_mock(system_state_monitor_template)
     mock.is_screen_locked.return_value = False
     mock.check_and_notify.return_value = False
     mock.get_state_description.return_value = "unlocked"
@@ -176,7 +214,7 @@ def mock_system_state_monitor() -> MagicMock:
 
 
 @pytest.fixture(scope="function")
-def integration_controller(  # noqa: PLR0917
+def make_controller(  # noqa: PLR0917
     capture_config: CaptureConfig,
     mock_screenshot_capture: MagicMock,
     mock_image_processor: MagicMock,
@@ -185,16 +223,58 @@ def integration_controller(  # noqa: PLR0917
     mock_window_enumerator: MagicMock,
     mock_date_directory_manager: MagicMock,
     mock_system_state_monitor: MagicMock,
+) -> Generator[Callable[..., CaptureController], None, None]:
+    """Return a builder wiring the mock components into a CaptureController."""
+    controllers: list[CaptureController] = []
+
+    def make(*, save_all_captures: bool = False) -> CaptureController:
+        controller = CaptureController(
+            config=replace(capture_config, save_all_captures=save_all_captures),
+            screenshot_capture=mock_screenshot_capture,
+            image_processor=mock_image_processor,
+            change_detector=mock_change_detector,
+            focus_tracker=mock_focus_tracker,
+            window_enumerator=mock_window_enumerator,
+            date_directory_manager=mock_date_directory_manager,
+            system_state_monitor=mock_system_state_monitor,
+        )
+        controllers.append(controller)
+        return controller
+
+    yield make
+    # The mocks are shared session templates, so don't leave a capture
+    # thread running into the next test
+    for controller in controllers:
+        if controller.is_running:
+            controller.stop()
+
+
+@pytest.fixture(scope="function")
+def integration_controller(
+    make_controller: Callable[..., CaptureController],
 ) -> CaptureController:
     """Create a CaptureController configured for integration testing."""
+    return make_controller()
+
+
+@pytest.fixture(scope="function")
+def minimal_controller(
+    capture_config: CaptureConfig,
+    mock_system_state_monitor: MagicMock,
+) -> CaptureController:
+    """Create a CaptureController for tests that never run a capture.
+
+    Only the system state monitor is specced; the other collaborators are
+    plain mocks because pause/resume handling never touches them.
+    """
     return CaptureController(
         config=capture_config,
-        screenshot_capture=mock_screenshot_capture,
-        image_processor=mock_image_processor,
-        change_detector=mock_change_detector,
-        focus_tracker=mock_focus_tracker,
-        window_enumerator=mock_window_enumerator,
-        date_directory_manager=mock_date_directory_manager,
+        screenshot_capture=MagicMock(),
+        image_processor=MagicMock(),
+        change_detector=MagicMock(),
+        focus_tracker=MagicMock(),
+        window_enumerator=MagicMock(),
+        date_directory_manager=MagicMock(),
         system_state_monitor=mock_system_state_monitor,
     )
 
@@ -212,87 +292,23 @@ class TestCompleteCaptureCycle:
 
     def test_full_capture_workflow(
         self,
-        temp_output_dir: Path,
-        sample_focused_app: FocusedAppData,
-        sample_windows: tuple[WindowInfo, ...],
+        integration_controller: CaptureController,
     ) -> None:
         """Test the complete capture workflow from start to finish."""
-        mock_screenshot_capture = MagicMock(spec=ScreenshotCapture)
-        mock_screenshot_capture.capture_all_monitors.return_value = {
-            1: Image.new("RGB", (1920, 1080), color="blue"),
-        }
+        capture_complete_callback = _Counter()
+        integration_controller.add_on_capture_callback(capture_complete_callback)
 
-        mock_image_processor = MagicMock(spec=ImageProcessor)
-        mock_image_processor.stitch_horizontally.return_value = Image.new(
-            "RGB", (1920, 1080), color="green"
-        )
-
-        mock_change_detector = MagicMock(spec=ChangeDetector)
-        mock_change_detector.has_changed.return_value = True
-
-        mock_focus_tracker = MagicMock(spec=FocusTracker)
-        mock_focus_tracker.get_focused_application.return_value = sample_focused_app
-
-        mock_window_enumerator = MagicMock(spec=WindowEnumerator)
-        mock_window_enumerator.enumerate_windows.return_value = sample_windows
-
-        mock_date_directory_manager = MagicMock(spec=DateDirectoryManager)
-        today = datetime.now(UTC)
-        date_dir = (
-            temp_output_dir
-            / f"{today.year:04d}"
-            / f"{today.month:02d}"
-            / f"{today.day:02d}"
-        )
-        date_dir.mkdir(parents=True, exist_ok=True)
-        mock_date_directory_manager.ensure_date_directory.return_value = date_dir
-        mock_date_directory_manager.get_screenshot_path.return_value = (
-            date_dir / f"{today.strftime("%Y%m%d_%H%M%S")}.png"
-        )
-
-        mock_system_state_monitor = MagicMock(spec=SystemStateMonitor)
-        mock_system_state_monitor.is_screen_locked.return_value = False
-        mock_system_state_monitor.check_and_notify.return_value = False
-        mock_system_state_monitor.get_state_description.return_value = "unlocked"
-
-        capture_complete_callback = MagicMock()
-
-        config = CaptureConfig(
-            output_directory=temp_output_dir,
-            capture_interval_seconds=1,
-            change_threshold=10,
-            save_all_captures=False,
-        )
-
-        controller = CaptureController(
-            config=config,
-            screenshot_capture=mock_screenshot_capture,
-            image_processor=mock_image_processor,
-            change_detector=mock_change_detector,
-            focus_tracker=mock_focus_tracker,
-            window_enumerator=mock_window_enumerator,
-            date_directory_manager=mock_date_directory_manager,
-            system_state_monitor=mock_system_state_monitor,
-        )
-
-        controller.add_on_capture_callback(capture_complete_callback)
-
-        controller.start()
-
-        try:
-            controller._perform_capture()
-
-            assert controller.capture_count == 1
-            capture_complete_callback.assert_called_once_with(1)
+        # No start(): the capture loop would race this manual capture
+        integration_controller._perform_capture()
 
-        finally:
-            controller.stop()
+        assert integration_controller.capture_count == 1
+        assert capture_complete_callback.count == 1
+        assert capture_complete_callback.last_args == (1,)
 
     def test_screenshot_storage_integration(
         self,
         integration_controller: CaptureController,
         mock_date_directory_manager: MagicMock,
-        _temp_output_dir: Path,
     ) -> None:
         """Test that screenshots are stored correctly."""
         integration_controller.start()
@@ -316,8 +332,6 @@ class TestCompleteCaptureCycle:
         integration_controller: CaptureController,
         mock_focus_tracker: MagicMock,
         mock_window_enumerator: MagicMock,
-        _sample_focused_app: FocusedAppData,
-        _sample_windows: tuple[WindowInfo, ...],
     ) -> None:
         """Test that window data is collected correctly."""
         integration_controller.start()
@@ -345,107 +359,58 @@ class TestCompleteCaptureCycle:
 
         mock_change_detector.has_changed.assert_called_once()
 
-    def test_save_all_captures_mode(  # noqa: PLR0917
+    def test_save_all_captures_mode(
         self,
-        temp_output_dir: Path,
-        mock_screenshot_capture: MagicMock,
-        mock_image_processor: MagicMock,
+        make_controller: Callable[..., CaptureController],
         mock_change_detector: MagicMock,
-        mock_focus_tracker: MagicMock,
-        mock_window_enumerator: MagicMock,
-        mock_date_directory_manager: MagicMock,
-        mock_system_state_monitor: MagicMock,
-        _sample_focused_app: FocusedAppData,
-        _sample_windows: tuple[WindowInfo, ...],
         sample_composite: Image.Image,
     ) -> None:
         """Test capture with save_all_captures enabled."""
-        config = CaptureConfig(
-            output_directory=temp_output_dir,
-            capture_interval_seconds=1,
-            change_threshold=10,
-            save_all_captures=True,
-        )
-
-        controller = CaptureController(
-            config=config,
-            screenshot_capture=mock_screenshot_capture,
-            image_processor=mock_image_processor,
-            change_detector=mock_change_detector,
-            focus_tracker=mock_focus_tracker,
-            window_enumerator=mock_window_enumerator,
-            date_directory_manager=mock_date_directory_manager,
-            system_state_monitor=mock_system_state_monitor,
-        )
+        controller = make_controller(save_all_captures=True)
 
         controller._previous_composite = sample_composite
         mock_change_detector.has_changed.return_value = False
 
-        controller.start()
-        try:
-            controller._perform_capture()
+        controller._perform_capture()
 
-            assert controller.capture_count == 1
-        finally:
-            controller.stop()
+        assert controller.capture_count == 1
 
 
 class TestErrorRecovery:
     """Integration tests for error recovery and system state handling."""
 
-    def test_capture_failure_recovery(
-        self,
-        integration_controller: CaptureController,
-        mock_screenshot_capture: MagicMock,
-    ) -> None:
-        """Test that capture failures are handled gracefully."""
-        mock_screenshot_capture.capture_all_monitors.side_effect = OSError(
-            "Failed to capture screenshot"
-        )
-
-        integration_controller.start()
-
-        try:
-            integration_controller._perform_capture()
-
-            last_error = integration_controller.last_error_msg
-            assert last_error is not None
-            assert "Failed to capture screenshot" in last_error
-
-        finally:
-            integration_controller.stop()
-
-    def test_focus_tracker_failure_recovery(
-        self,
-        integration_controller: CaptureController,
-        mock_focus_tracker: MagicMock,
-    ) -> None:
-        """Test that focus tracker failures are handled gracefully."""
-        mock_focus_tracker.get_focused_application.side_effect = Exception(
-            "Failed to get focused app"
-        )
-
-        integration_controller.start()
-
-        try:
-            integration_controller._perform_capture()
-
-            last_error = integration_controller.last_error_msg
-            assert last_error is not None
-            assert "Failed to get focused app" in last_error
-
-        finally:
-            integration_controller.stop()
-
-    def test_image_processor_failure_recovery(
+    @pytest.mark.parametrize(
+        ("mock_name", "method", "exc"),
+        [
+            (
+                "mock_screenshot_capture",
+                "capture_all_monitors",
+                OSError("Failed to capture screenshot"),
+            ),
+            (
+                "mock_focus_tracker",
+                "get_focused_application",
+                Exception("Failed to get focused app"),
+            ),
+            (
+                "mock_image_processor",
+                "stitch_horizontally",
+                Exception("Failed to stitch images"),
+            ),
+        ],
+        ids=["capture", "focus_tracker", "image_processor"],
+    )
+    def test_failure_recovery(
         self,
+        request: pytest.FixtureRequest,
         integration_controller: CaptureController,
-        mock_image_processor: MagicMock,
+        mock_name: str,
+        method: str,
+        exc: Exception,
     ) -> None:
-        """Test that image processor failures are handled gracefully."""
-        mock_image_processor.stitch_horizontally.side_effect = Exception(
-            "Failed to stitch images"
-        )
+        """Test that component failures are handled gracefully."""
+        mock = request.getfixturevalue(mock_name)
+        getattr(mock, method).side_effect = exc
 
         integration_controller.start()
 
@@ -454,7 +419,7 @@ class TestErrorRecovery:
 
             last_error = integration_controller.last_error_msg
             assert last_error is not None
-            assert "Failed to stitch images" in last_error
+            assert str(exc) in last_error
 
         finally:
             integration_controller.stop()
@@ -465,36 +430,35 @@ class TestSystemStateHandling:
 
     def test_screen_lock_pause(
         self,
-        integration_controller: CaptureController,
+        minimal_controller: CaptureController,
         mock_system_state_monitor: MagicMock,
     ) -> None:
         """Test that capture pauses when screen is locked."""
-        pause_callback = MagicMock()
-        integration_controller.add_on_pause_callback(pause_callback)
+        pause_callback = _Counter()
+        minimal_controller.add_on_pause_callback(pause_callback)
 
         mock_system_state_monitor.check_and_notify.return_value = True
         mock_system_state_monitor.is_screen_locked.return_value = True
 
-        integration_controller._is_paused = False
-        integration_controller._handle_pause()
+        minimal_controller._is_paused = False
+        minimal_controller._handle_pause()
 
-        assert integration_controller._is_paused is True
-        pause_callback.assert_called_once()
+        assert minimal_controller._is_paused is True
+        assert pause_callback.count == 1
 
     def test_screen_unlock_resume(
         self,
-        integration_controller: CaptureController,
-        _mock_system_state_monitor: MagicMock,
+        minimal_controller: CaptureController,
     ) -> None:
         """Test that capture resumes when screen is unlocked."""
-        resume_callback = MagicMock()
-        integration_controller.add_on_resume_callback(resume_callback)
+        resume_callback = _Counter()
+        minimal_controller.add_on_resume_callback(resume_callback)
 
-        integration_controller._is_paused = True
-        integration_controller._handle_resume()
+        minimal_controller._is_paused = True
+        minimal_controller._handle_resume()
 
-        assert integration_controller._is_paused is False
-        resume_callback.assert_called_once()
+        assert minimal_controller._is_paused is False
+        assert resume_callback.count == 1
 
     def test_system_state_monitoring(
         self,
@@ -519,71 +483,22 @@ class TestMultiMonitorSupport:
 
     def test_multi_monitor_capture(
         self,
-        temp_output_dir: Path,
-        sample_focused_app: FocusedAppData,
-        sample_windows: tuple[WindowInfo, ...],
+        integration_controller: CaptureController,
+        mock_screenshot_capture: MagicMock,
+        mock_image_processor: MagicMock,
     ) -> None:
         """Test capture with multiple monitors."""
-        mock_screenshot_capture = MagicMock(spec=ScreenshotCapture)
         mock_screenshot_capture.capture_all_monitors.return_value = {
-            1: Image.new("RGB", (1920, 1080), color="blue"),
-            2: Image.new("RGB", (2560, 1440), color="red"),
+            1: Image.new("RGB", (1, 1), color="blue"),
+            2: Image.new("RGB", (1, 1), color="red"),
         }
-
-        mock_image_processor = MagicMock(spec=ImageProcessor)
         mock_image_processor.stitch_horizontally.return_value = Image.new(
-            "RGB", (4480, 1440), color="purple"
-        )
-
-        mock_change_detector = MagicMock(spec=ChangeDetector)
-        mock_change_detector.has_changed.return_value = True
-
-        mock_focus_tracker = MagicMock(spec=FocusTracker)
-        mock_focus_tracker.get_focused_application.return_value = sample_focused_app
-
-        mock_window_enumerator = MagicMock(spec=WindowEnumerator)
-        mock_window_enumerator.enumerate_windows.return_value = sample_windows
-
-        mock_date_directory_manager = MagicMock(spec=DateDirectoryManager)
-        today = datetime.now(UTC)
-        date_dir = (
-            temp_output_dir
-            / f"{today.year:04d}"
-            / f"{today.month:02d}"
-            / f"{today.day:02d}"
-        )
-        date_dir.mkdir(parents=True, exist_ok=True)
-        mock_date_directory_manager.ensure_date_directory.return_value = date_dir
-        mock_date_directory_manager.get_screenshot_path.return_value = (
-            date_dir / f"{today.strftime("%Y%m%d_%H%M%S")}.png"
-        )
-
-        mock_system_state_monitor = MagicMock(spec=SystemStateMonitor)
-        mock_system_state_monitor.is_screen_locked.return_value = False
-        mock_system_state_monitor.check_and_notify.return_value = False
-        mock_system_state_monitor.get_state_description.return_value = "unlocked"
-
-        config = CaptureConfig(
-            output_directory=temp_output_dir,
-            capture_interval_seconds=1,
-            change_threshold=10,
-            save_all_captures=False,
-        )
-
-        controller = CaptureController(
-            config=config,
-            screenshot_capture=mock_screenshot_capture,
-            image_processor=mock_image_processor,
-            change_detector=mock_change_detector,
-            focus_tracker=mock_focus_tracker,
-            window_enumerator=mock_window_enumerator,
-            date_directory_manager=mock_date_directory_manager,
-            system_state_monitor=mock_system_state_monitor,
+            "RGB", (1, 1), color="purple"
         )
 
-        controller._perform_capture()
+        integration_controller._perform_capture()
 
-        assert controller.capture_count == 1
+        assert integration_controller.capture_count == 1
 
 
 class TestCallbackSystem:
@@ -594,11 +509,11 @@ class TestCallbackSystem:
         integration_controller: CaptureController,
     ) -> None:
         """Test that all callback types work together."""
-        start_callback = MagicMock()
-        stop_callback = MagicMock()
-        capture_callback = MagicMock()
-        pause_callback = MagicMock()
-        resume_callback = MagicMock()
+        start_callback = _Counter()
+        stop_callback = _Counter()
+        capture_callback = _Counter()
+        pause_callback = _Counter()
+        resume_callback = _Counter()
 
         integration_controller.add_on_start_callback(start_callback)
         integration_controller.add_on_stop_callback(stop_callback)
@@ -606,20 +521,23 @@ class TestCallbackSystem:
         integration_controller.add_on_pause_callback(pause_callback)
         integration_controller.add_on_resume_callback(resume_callback)
 
-        integration_controller.start()
-        start_callback.assert_called_once()
-
+        # Capture manually before start(); once running, the capture loop
+        # would race it
         integration_controller._perform_capture()
-        capture_callback.assert_called_once_with(1)
+        assert capture_callback.count == 1
+        assert capture_callback.last_args == (1,)
 
         integration_controller._handle_pause()
-        pause_callback.assert_called_once()
+        assert pause_callback.count == 1
 
         integration_controller._handle_resume()
-        resume_callback.assert_called_once()
+        assert resume_callback.count == 1
+
+        integration_controller.start()
+        assert start_callback.count == 1
 
         integration_controller.stop()
-        stop_callback.assert_called_once()
+        assert stop_callback.count == 1
 
     def test_callback_exception_handling(
         self,
@@ -645,71 +563,13 @@ class TestControllerStatus:
 
     def test_status_after_captures(
         self,
-        temp_output_dir: Path,
-        sample_focused_app: FocusedAppData,
-        sample_windows: tuple[WindowInfo, ...],
+        integration_controller: CaptureController,
     ) -> None:
         """Test that status reflects capture statistics."""
-        mock_screenshot_capture = MagicMock(spec=ScreenshotCapture)
-        mock_screenshot_capture.capture_all_monitors.return_value = {
-            1: Image.new("RGB", (1920, 1080), color="blue"),
-        }
-
-        mock_image_processor = MagicMock(spec=ImageProcessor)
-        mock_image_processor.stitch_horizontally.return_value = Image.new(
-            "RGB", (1920, 1080), color="green"
-        )
-
-        mock_change_detector = MagicMock(spec=ChangeDetector)
-        mock_change_detector.has_changed.return_value = True
-
-        mock_focus_tracker = MagicMock(spec=FocusTracker)
-        mock_focus_tracker.get_focused_application.return_value = sample_focused_app
-
-        mock_window_enumerator = MagicMock(spec=WindowEnumerator)
-        mock_window_enumerator.enumerate_windows.return_value = sample_windows
-
-        mock_date_directory_manager = MagicMock(spec=DateDirectoryManager)
-        today = datetime.now(UTC)
-        date_dir = (
-            temp_output_dir
-            / f"{today.year:04d}"
-            / f"{today.month:02d}"
-            / f"{today.day:02d}"
-        )
-        date_dir.mkdir(parents=True, exist_ok=True)
-        mock_date_directory_manager.ensure_date_directory.return_value = date_dir
-        mock_date_directory_manager.get_screenshot_path.return_value = (
-            date_dir / f"{today.strftime("%Y%m%d_%H%M%S")}.png"
-        )
-
-        mock_system_state_monitor = MagicMock(spec=SystemStateMonitor)
-        mock_system_state_monitor.is_screen_locked.return_value = False
-        mock_system_state_monitor.check_and_notify.return_value = False
-        mock_system_state_monitor.get_state_description.return_value = "unlocked"
-
-        config = CaptureConfig(
-            output_directory=temp_output_dir,
-            capture_interval_seconds=1,
-            change_threshold=10,
-            save_all_captures=False,
-        )
-
-        controller = CaptureController(
-            config=config,
-            screenshot_capture=mock_screenshot_capture,
-            image_processor=mock_image_processor,
-            change_detector=mock_change_detector,
-            focus_tracker=mock_focus_tracker,
-            window_enumerator=mock_window_enumerator,
-            date_directory_manager=mock_date_directory_manager,
-            system_state_monitor=mock_system_state_monitor,
-        )
-
         for _ in range(3):
-            controller._perform_capture()
+            integration_controller._perform_capture()
 
-        status = controller.get_status()
+        status = integration_controller.get_status()
 
         assert status["capture_count"] == 3
         assert status["capture_interval_seconds"] == 1
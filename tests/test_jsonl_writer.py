@@ -1,12 +1,17 @@
 from datetime import UTC, datetime
 import json
 from pathlib import Path
+from typing import NoReturn
 
 import pytest
 
 from activity_beacon.file_storage.jsonl_writer import JSONLWriter
 
 
+def _deny(*_args: object, **_kwargs: object) -> NoReturn:
+    raise PermissionError("Permission denied")
+
+
 class TestJSONLWriter:
     def test_init_with_path_object(self, tmp_path: Path) -> None:
         writer = JSONLWriter(tmp_path / "data.jsonl")
@@ -89,16 +94,14 @@ class TestJSONLWriter:
         writer.write(entry)
         assert (tmp_path / "nested" / "path" / "data.jsonl").exists()
 
-    def test_write_permission_error(self, tmp_path: Path) -> None:
+    def test_write_permission_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         writer = JSONLWriter(tmp_path / "readonly" / "data.jsonl")
-        (tmp_path / "readonly").mkdir()
-        (tmp_path / "readonly").chmod(0o444)
+        monkeypatch.setattr(Path, "open", _deny)
         entry = {"key": "value"}
-        try:
-            with pytest.raises(OSError, match="Permission denied"):
-                writer.write(entry)
-        finally:
-            (tmp_path / "readonly").chmod(0o755)
+        with pytest.raises(OSError, match="Permission denied"):
+            writer.write(entry)
 
     def test_file_exists_returns_true_when_file_exists(self, tmp_path: Path) -> None:
         writer = JSONLWriter(tmp_path / "data.jsonl")
@@ -113,10 +116,11 @@ class TestJSONLWriter:
         writer = JSONLWriter(tmp_path / "data.jsonl")
         assert writer.last_error_msg is None
 
-    def test_last_error_msg_set_on_error(self, tmp_path: Path) -> None:
+    def test_last_error_msg_set_on_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         writer = JSONLWriter(tmp_path / "readonly" / "data.jsonl")
-        (tmp_path / "readonly").mkdir()
-        (tmp_path / "readonly").chmod(0o444)
+        monkeypatch.setattr(Path, "open", _deny)
         with pytest.raises(OSError):
             writer.write({"key": "value"})
         assert writer.last_error_msg is not None
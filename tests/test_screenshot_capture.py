@@ -1,7 +1,6 @@
 from contextlib import ExitStack
 from dataclasses import FrozenInstanceError
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from unittest.mock import MagicMock, patch
 
 from PIL import Image
@@ -186,9 +185,8 @@ class TestScreenshotCapture:
             with pytest.raises(ValueError, match="Monitor 99 not found"):
                 capture.capture_monitor(99)
 
-    def test_capture_to_path(self) -> None:
+    def test_capture_to_path(self, tmp_path: Path) -> None:
         with ExitStack() as stack:
-            tmpdir = stack.enter_context(TemporaryDirectory())
             mock_mss = stack.enter_context(patch("mss.mss"))
             mock_frombytes = stack.enter_context(
                 patch("activity_beacon.screenshot.capture.Image.frombytes")
@@ -211,7 +209,7 @@ class TestScreenshotCapture:
 
             capture = ScreenshotCapture()
             output_path = capture.capture_to_path(
-                1, Path(tmpdir) / "test.png", format="PNG"
+                1, tmp_path / "test.png", format="PNG"
             )
 
             mock_image.save.assert_called_once()
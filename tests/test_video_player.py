@@ -0,0 +1,107 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication
+import pytest
+
+# QtMultimedia needs the platform media backend (e.g. PulseAudio on Linux)
+pytest.importorskip("PyQt6.QtMultimedia", exc_type=ImportError)
+
+from activity_beacon.viewer.main import MainWindow
+from activity_beacon.viewer.video_player import (
+    POSITION_UPDATE_INTERVAL_MS,
+    VideoPlayerWidget,
+)
+
+
+@pytest.fixture
+def player_widget(qapp: QApplication) -> VideoPlayerWidget:  # noqa: ARG001
+    """Create a player widget; no video is loaded, so no QMediaPlayer exists."""
+    return VideoPlayerWidget()
+
+
+@pytest.fixture
+def emitted(player_widget: VideoPlayerWidget) -> list[int]:
+    """Collect the positions the widget publishes through position_changed."""
+    positions: list[int] = []
+    player_widget.position_changed.connect(positions.append)
+    return positions
+
+
+class TestPositionThrottle:
+    def test_position_updates_coalesced(
+        self, player_widget: VideoPlayerWidget, emitted: list[int]
+    ) -> None:
+        player_widget._position_slider.setRange(0, 10_000)
+        for pos in (100, 200, 300, 1_500):
+            player_widget._on_position_changed(pos)
+
+        assert emitted == []
+
+        QTest.qWait(POSITION_UPDATE_INTERVAL_MS * 3)
+
+        assert emitted == [1_500]
+        assert player_widget._position_slider.value() == 1_500
+        assert player_widget._position_label.text() == "00:01"
+
+    def test_slider_drag_bypasses_throttle(
+        self, player_widget: VideoPlayerWidget, emitted: list[int]
+    ) -> None:
+        player_widget._position_slider.setRange(0, 10_000)
+        player_widget._on_position_changed(100)
+
+        player_widget._position_slider.sliderMoved.emit(6_500)
+
+        assert emitted == [6_500]
+        assert not player_widget._pos_timer.isActive()
+        assert player_widget._position_label.text() == "00:06"
+
+        # The superseded throttled update must not fire afterwards
+        QTest.qWait(POSITION_UPDATE_INTERVAL_MS * 3)
+        assert emitted == [6_500]
+
+
+class TestLazyPlayer:
+    def test_controls_before_any_video(self, player_widget: VideoPlayerWidget) -> None:
+        assert player_widget._player is None
+
+        player_widget.set_volume(30)
+        player_widget.seek(500)
+        player_widget.play()
+        player_widget.pause()
+        player_widget._toggle_play()
+
+        assert player_widget.get_duration() == 0
+        assert player_widget.get_position() == 0
+        assert player_widget._player is None
+        assert player_widget._volume == pytest.approx(0.3)
+
+    def test_stored_volume_applied_on_creation(
+        self, player_widget: VideoPlayerWidget
+    ) -> None:
+        player_widget.set_volume(30)
+
+        player_widget._ensure_player()
+
+        assert player_widget._audio is not None
+        assert player_widget._audio.volume() == pytest.approx(0.3)
+
+    def test_volume_slider_before_any_video(
+        self, player_widget: VideoPlayerWidget
+    ) -> None:
+        player_widget._volume_slider.setValue(80)
+
+        player_widget._ensure_player()
+
+        assert player_widget._audio is not None
+        assert player_widget._audio.volume() == pytest.approx(0.8)
+
+    def test_duration_handler_skipped_without_player(
+        self, player_widget: VideoPlayerWidget
+    ) -> None:
+        window = SimpleNamespace(_video_player=player_widget, _timeline=None)
+
+        MainWindow._setup_duration_changed_handler(window, datetime(2024, 3, 15))  # type: ignore[arg-type]
+
+        assert player_widget._player is None
@@ -0,0 +1,172 @@
+from collections import OrderedDict
+from datetime import date, datetime
+import json
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from activity_beacon.viewer.main import MainWindow
+from activity_beacon.viewer.window_data_parser import (
+    ERROR_MALFORMED_JSON,
+    WindowDataParser,
+)
+
+_DAY = date(2024, 3, 15)
+_MIN_ISO = "2024-03-15"
+_MAX_ISO = "2024-03-16"
+
+
+def _line(timestamp: str, app: str = "Safari") -> str:
+    return json.dumps({
+        "timestamp": timestamp,
+        "focused_app_name": app,
+        "focused_app_pid": 123,
+        "focused_window_name": "Page",
+        "windows": [
+            {
+                "app_name": app,
+                "window_name": "Page",
+                "owner_pid": 123,
+                "is_active": True,
+                "is_focused_window": True,
+            }
+        ],
+    })
+
+
+@pytest.fixture
+def parser() -> WindowDataParser:
+    return WindowDataParser()
+
+
+class TestWindowDataParser:
+    def test_missing_file_returns_empty(
+        self, parser: WindowDataParser, tmp_path: Path
+    ) -> None:
+        assert parser.parse_file(tmp_path / "window_data.jsonl") == []
+
+    def test_empty_file_returns_empty(
+        self, parser: WindowDataParser, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "window_data.jsonl"
+        path.write_bytes(b"")
+
+        assert parser.parse_file(path) == []
+
+    def test_missing_trailing_newline(
+        self, parser: WindowDataParser, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "window_data.jsonl"
+        path.write_text(
+            _line("2024-03-15T10:00:00", "First")
+            + "\n"
+            + _line("2024-03-15T10:00:01", "Last")
+        )
+
+        entries = parser.parse_file(path)
+
+        assert [e.focused_app_name for e in entries] == ["First", "Last"]
+
+    def test_crlf_line_endings(self, parser: WindowDataParser, tmp_path: Path) -> None:
+        path = tmp_path / "window_data.jsonl"
+        path.write_bytes(
+            (
+                _line("2024-03-15T10:00:00", "First")
+                + "\r\n"
+                + _line("2024-03-15T10:00:01", "Second")
+                + "\r\n"
+            ).encode()
+        )
+
+        entries = parser.parse_file(path)
+
+        assert [e.focused_app_name for e in entries] == ["First", "Second"]
+        assert entries[1].timestamp == datetime(2024, 3, 15, 10, 0, 1)
+
+    def test_blank_lines_skipped(
+        self, parser: WindowDataParser, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "window_data.jsonl"
+        path.write_text("\n\n" + _line("2024-03-15T10:00:00") + "\n\n")
+
+        assert len(parser.parse_file(path)) == 1
+
+    def test_entries_outside_day_range_skipped(
+        self, parser: WindowDataParser, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "window_data.jsonl"
+        path.write_text(
+            "\n".join([
+                _line("2024-03-14T23:59:59", "Before"),
+                _line("2024-03-15T00:00:00", "Start"),
+                _line("2024-03-15T23:59:59", "End"),
+                _line("2024-03-16T00:00:01", "After"),
+            ])
+        )
+
+        entries = parser.parse_file(path, min_iso=_MIN_ISO, max_iso=_MAX_ISO)
+
+        assert [e.focused_app_name for e in entries] == ["Start", "End"]
+
+    def test_out_of_range_entries_are_not_errors(
+        self, parser: WindowDataParser, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        entry, error = parser.parse_line(
+            _line("2024-03-16T00:00:01"), min_iso=_MIN_ISO, max_iso=_MAX_ISO
+        )
+
+        assert entry is None
+        assert error is None
+        assert not caplog.records
+
+    def test_parse_line_accepts_bytes(self, parser: WindowDataParser) -> None:
+        entry, error = parser.parse_line(_line("2024-03-15T10:00:00").encode())
+
+        assert error is None
+        assert entry is not None
+        assert entry.focused_app_pid == 123
+
+    def test_malformed_line_reported(self, parser: WindowDataParser) -> None:
+        entry, error = parser.parse_line(b"{not json")
+
+        assert entry is None
+        assert error == ERROR_MALFORMED_JSON
+
+
+class TestWindowDataCache:
+    @pytest.fixture
+    def window(self, parser: WindowDataParser) -> SimpleNamespace:
+        """Stand in for MainWindow with just the state _parse_window_data uses."""
+        return SimpleNamespace(_entry_cache=OrderedDict(), _get_parser=lambda: parser)
+
+    @pytest.fixture
+    def data_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "window_data.jsonl"
+        path.write_text(_line("2024-03-15T10:00:00", "Before") + "\n")
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+        return path
+
+    def test_unchanged_file_served_from_cache(
+        self, window: SimpleNamespace, data_file: Path
+    ) -> None:
+        first = MainWindow._parse_window_data(window, data_file, _DAY)  # type: ignore[arg-type]
+        second = MainWindow._parse_window_data(window, data_file, _DAY)  # type: ignore[arg-type]
+
+        assert second is first
+
+    def test_mtime_change_invalidates_cache(
+        self, window: SimpleNamespace, data_file: Path
+    ) -> None:
+        first = MainWindow._parse_window_data(window, data_file, _DAY)  # type: ignore[arg-type]
+
+        data_file.write_text(
+            _line("2024-03-15T10:00:00", "After") + "\n", encoding="utf-8"
+        )
+        os.utime(data_file, ns=(2_000_000_000, 2_000_000_000))
+        second = MainWindow._parse_window_data(window, data_file, _DAY)  # type: ignore[arg-type]
+
+        assert second is not first
+        assert [e.focused_app_name for e in first] == ["Before"]
+        assert [e.focused_app_name for e in second] == ["After"]
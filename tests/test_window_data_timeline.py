@@ -0,0 +1,214 @@
+from array import array
+from bisect import bisect_right
+from datetime import UTC, datetime, timedelta, timezone
+
+from PyQt6.QtCore import QAbstractTableModel, Qt
+from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QApplication
+import pytest
+
+from activity_beacon.viewer.window_data_parser import WindowDataEntry, WindowInfo
+from activity_beacon.viewer.window_data_timeline import (
+    CURSOR_SCAN_STEPS,
+    WindowDataTimeline,
+)
+
+
+def _linear_index(positions: list[int], pos_ms: int) -> int:
+    """Reference lookup: last entry at or before pos_ms, clamped to the first."""
+    idx = 0
+    for i, p in enumerate(positions):
+        if p <= pos_ms:
+            idx = i
+    return idx
+
+
+def _entry(timestamp: datetime) -> WindowDataEntry:
+    return WindowDataEntry(
+        timestamp=timestamp,
+        focused_app_name=None,
+        focused_app_pid=None,
+        focused_window_name=None,
+        windows=[],
+    )
+
+
+@pytest.fixture
+def timeline(qapp: QApplication) -> WindowDataTimeline:  # noqa: ARG001
+    """Create a timeline widget; widgets need the QApplication to exist."""
+    return WindowDataTimeline()
+
+
+def _with_positions(
+    timeline: WindowDataTimeline, positions: list[int]
+) -> WindowDataTimeline:
+    timeline._entry_positions = array("q", positions)
+    timeline._cursor = 0
+    return timeline
+
+
+class TestFindIndexForPosition:
+    def test_empty_timeline(self, timeline: WindowDataTimeline) -> None:
+        assert _with_positions(timeline, [])._find_index_for_position(0) is None
+
+    @pytest.mark.parametrize("pos_ms", [-5, 0, 500, 10_000])
+    def test_single_entry(self, timeline: WindowDataTimeline, pos_ms: int) -> None:
+        assert _with_positions(timeline, [500])._find_index_for_position(pos_ms) == 0
+
+    @pytest.mark.parametrize(
+        "pos_ms", [-1, 0, 50, 99, 100, 150, 300, 301, 10_000], ids=str
+    )
+    def test_matches_linear_search(
+        self, timeline: WindowDataTimeline, pos_ms: int
+    ) -> None:
+        positions = [50, 100, 200, 300]
+        _with_positions(timeline, positions)
+
+        assert timeline._find_index_for_position(pos_ms) == _linear_index(
+            positions, pos_ms
+        )
+
+    def test_before_first_entry_clamps_to_zero(
+        self, timeline: WindowDataTimeline
+    ) -> None:
+        _with_positions(timeline, [100, 200, 300])
+
+        assert timeline._find_index_for_position(0) == 0
+
+    def test_after_last_entry_returns_last(self, timeline: WindowDataTimeline) -> None:
+        _with_positions(timeline, [100, 200, 300])
+
+        assert timeline._find_index_for_position(5_000) == 2
+
+    @pytest.mark.parametrize("pos_ms", [100, 150, 199, 200, 250])
+    def test_duplicate_timestamps_return_last_of_run(
+        self, timeline: WindowDataTimeline, pos_ms: int
+    ) -> None:
+        positions = [0, 100, 100, 100, 200, 200, 300]
+        _with_positions(timeline, positions)
+
+        idx = timeline._find_index_for_position(pos_ms)
+
+        assert idx == _linear_index(positions, pos_ms)
+        assert idx == bisect_right(positions, pos_ms) - 1
+
+    def test_scrubbing_around_cursor(self, timeline: WindowDataTimeline) -> None:
+        positions = [i * 100 for i in range(50)]
+        _with_positions(timeline, positions)
+        far = (CURSOR_SCAN_STEPS + 5) * 100
+        # Step forward inside the scan window, then jump past it in both
+        # directions, then step backward
+        sequence = [
+            0,
+            50,
+            150,
+            250,
+            260,
+            250 + far,
+            250 + far + 100,
+            250,
+            150,
+            50,
+            4_950,
+            0,
+            far * 3,
+            far * 3 - 100,
+        ]
+
+        for pos_ms in sequence:
+            assert timeline._find_index_for_position(pos_ms) == _linear_index(
+                positions, pos_ms
+            ), pos_ms
+
+
+class TestRecomputePositions:
+    def test_matches_per_entry_offsets(self, timeline: WindowDataTimeline) -> None:
+        start = datetime(2024, 3, 15, 10, 0, 0, tzinfo=UTC)
+        duration_ms = 3_600_000
+        plus_two = timezone(timedelta(hours=2))
+        timestamps = [
+            start - timedelta(seconds=5),  # before the video starts
+            start,
+            start + timedelta(milliseconds=1),
+            start + timedelta(seconds=1, microseconds=999),
+            start + timedelta(minutes=7, microseconds=123_456),
+            # A different UTC offset: 12:30 +02:00 is 10:30 UTC
+            datetime(2024, 3, 15, 12, 30, 0, 250_000, tzinfo=plus_two),
+            start + timedelta(hours=2),  # past the end of the video
+        ]
+        timeline.set_video_timing(start, duration_ms)
+
+        timeline.load_window_data([_entry(ts) for ts in timestamps])
+
+        expected = [
+            min(max(0, int((ts - start).total_seconds() * 1000)), duration_ms)
+            for ts in sorted(timestamps)
+        ]
+        assert list(timeline._entry_positions) == expected
+        assert expected[0] == 0
+        assert expected[-1] == duration_ms
+
+
+class TestEntriesModel:
+    @pytest.fixture
+    def model(self, timeline: WindowDataTimeline) -> QAbstractTableModel:
+        """Load two entries and return the table model behind the view."""
+        focused = WindowInfo(
+            app_name="Safari",
+            window_name="Example",
+            owner_pid=1,
+            is_active=True,
+            is_focused_window=True,
+        )
+        timeline.load_window_data([
+            WindowDataEntry(
+                timestamp=datetime(2024, 3, 15, 9, 5, 7),
+                focused_app_name="Safari",
+                focused_app_pid=1,
+                focused_window_name="Example",
+                windows=[focused],
+            ),
+            _entry(datetime(2024, 3, 15, 23, 59, 59)),
+        ])
+        return timeline._model
+
+    def test_shape(self, model: QAbstractTableModel) -> None:
+        assert model.rowCount() == 2
+        assert model.columnCount() == 3
+
+    @pytest.mark.parametrize(
+        ("row", "expected"),
+        [
+            (0, ["09:05:07", "Safari", "Example"]),
+            (1, ["23:59:59", "", ""]),
+        ],
+        ids=["active-window", "no-active-window"],
+    )
+    def test_display_role(
+        self, model: QAbstractTableModel, row: int, expected: list[str]
+    ) -> None:
+        cells = [
+            model.data(model.index(row, col), Qt.ItemDataRole.DisplayRole)
+            for col in range(3)
+        ]
+
+        assert cells == expected
+
+    def test_font_role_bolds_active_window_columns(
+        self, model: QAbstractTableModel
+    ) -> None:
+        fonts = [
+            model.data(model.index(0, col), Qt.ItemDataRole.FontRole)
+            for col in range(3)
+        ]
+
+        assert fonts[0] is None
+        assert all(isinstance(f, QFont) and f.bold() for f in fonts[1:])
+
+    def test_font_role_plain_without_active_window(
+        self, model: QAbstractTableModel
+    ) -> None:
+        assert all(
+            model.data(model.index(1, col), Qt.ItemDataRole.FontRole) is None
+            for col in range(3)
+        )
@@ -107,3 +107,28 @@ def test_enumerate_windows_missing_data(mock_quartz):
     assert not windows[0].window_name
     assert windows[0].pid == 103
     assert windows[0].screen_rect == (0, 0, 0, 0)
+
+
+class _FailingBounds(dict):
+    def get(self, *_args: object) -> object:
+        msg = "bad bounds"
+        raise RuntimeError(msg)
+
+
+def test_enumerate_windows_window_parse_error(mock_quartz):
+    """Test that a RuntimeError while reading a window is caught and recorded."""
+    mock_quartz.CGWindowListCopyWindowInfo.return_value = [
+        {
+            "kCGWindowLayer": 0,
+            "kCGWindowOwnerName": "Finder",
+            "kCGWindowOwnerPID": 100,
+            "kCGWindowBounds": _FailingBounds(X=0),
+        },
+    ]
+
+    enumerator = WindowEnumerator()
+    windows = enumerator.enumerate_windows()
+
+    assert windows == ()
+    assert enumerator.last_error_msg is not None
+    assert "bad bounds" in enumerator.last_error_msg